@@ -32,24 +32,45 @@ TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 CREDENTIALS_PATH = os.getenv("CREDENTIALS_PATH", "credentials.json")
 TUTORS_CONFIG_PATH = os.getenv("TUTORS_CONFIG_PATH", "tutors_config.json")
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Size of the thread pool that runs blocking Sheets and file I/O
+IO_WORKERS = int(os.getenv("IO_WORKERS", "32"))
+# Upper bound on updates processed at the same time
+CONCURRENT_UPDATES = int(os.getenv("CONCURRENT_UPDATES", "256"))
+
+# Webhook mode is used when WEBHOOK_URL is set; otherwise the bot polls
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET")
+
+CREDENTIALS_FILE = os.path.join(str(BASE_DIR), CREDENTIALS_PATH)
+TUTORS_CONFIG_FILE = os.path.join(str(BASE_DIR), TUTORS_CONFIG_PATH)
+
+_validated = False
 
 
 def validate_config():
-    """Validate that required configuration is present."""
+    """Validate that required configuration is present.
+
+    The checks run once per process; later calls return immediately.
+    """
+    global _validated
+    if _validated:
+        return
+
     if not TELEGRAM_BOT_TOKEN:
         raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
     
-    credentials_file = BASE_DIR / CREDENTIALS_PATH
-    tutors_config_file = BASE_DIR / TUTORS_CONFIG_PATH
-    
-    if not credentials_file.exists():
+    if not os.path.isfile(CREDENTIALS_FILE):
         raise FileNotFoundError(
-            f"Credentials file not found at {credentials_file}. "
+            f"Credentials file not found at {CREDENTIALS_FILE}. "
             "Please ensure credentials.json is in the project root."
         )
     
-    if not tutors_config_file.exists():
+    if not os.path.isfile(TUTORS_CONFIG_FILE):
         raise FileNotFoundError(
-            f"Tutors config file not found at {tutors_config_file}. "
+            f"Tutors config file not found at {TUTORS_CONFIG_FILE}. "
             "Please ensure tutors_config.json is in the project root."
         )
+
+    _validated = True
@@ -1,37 +1,275 @@
 """Google Sheets manager for tutor applications."""
 
+import copy
+import inspect
 import os
 import json
-from typing import List, Optional, Dict, Any
-
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 from .exceptions import (
     AuthenticationError,
+    SheetsBackendError,
     SheetNotFoundError,
     WorksheetNotFoundError,
     MalformedDataError,
 )
 from utils.models import Student, Lesson, Payment, StudentRecord
 
+if TYPE_CHECKING:
+    import gspread
+
+logger = logging.getLogger(__name__)
+
 
 SCOPES = [
-    "https://spreadsheets.google.com/feeds",
+    "https://www.googleapis.com/auth/spreadsheets",
     "https://www.googleapis.com/auth/drive",
 ]
 
-WORKSHEET_HEADERS = {
-    "Ученики": ["Имя родителя", "Имя ученика", "Стоимость урока"],
-    "Уроки": ["Студент", "Дата", "Время", "Продолжительность", "Тема", "Заметки"],
-    "Платежи": ["Студент", "Сумма", "Дата", "Метод оплаты", "Заметки"],
-    "История": ["Дата", "Событие", "Деталь"],
-    "Настройки": ["Ключ", "Значение"],
-}
+WORKSHEET_HEADERS = MappingProxyType({
+    "Ученики": ("Имя родителя", "Имя ученика", "Стоимость урока"),
+    "Уроки": ("Студент", "Дата", "Время", "Продолжительность", "Тема", "Заметки"),
+    "Платежи": ("Студент", "Сумма", "Дата", "Метод оплаты", "Заметки"),
+    "История": ("Дата", "Событие", "Деталь"),
+    "Настройки": ("Ключ", "Значение"),
+})
+
+# Worksheet names in creation order
+_WORKSHEET_NAMES: Tuple[str, ...] = tuple(WORKSHEET_HEADERS)
+
+SETTINGS_CACHE_TTL = 60.0
+
+ROWS_CACHE_TTL = 30.0
+
+# Connections kept open to the Sheets API; handlers limit concurrent
+# calls to the same number so requests never wait for a free connection
+MAX_CONNECTIONS = 16
+
+RETRY_ATTEMPTS = 4
+
+# API statuses that may mean a cached handle points at a sheet that was
+# deleted or is no longer shared
+STALE_HANDLE_STATUSES = (403, 404)
+
+RETRY_BACKOFF_FACTOR = 1.0
+
+RETRY_STATUSES = (500, 502, 503, 504)
+
+
+def _gspread():
+    """Import gspread on first use; it pulls in the whole Google HTTP stack."""
+    import gspread
+
+    return gspread
+
+
+@lru_cache(maxsize=None)
+def _credentials(credentials_path: str):
+    """Load service account credentials once per key file.
+
+    The returned object holds the access token and refreshes it near expiry,
+    so every manager built from the same file shares a single token instead
+    of signing and exchanging a fresh JWT.
+    """
+    from google.oauth2.service_account import Credentials
+
+    return Credentials.from_service_account_file(credentials_path, scopes=SCOPES)
+
+
+def _mount_retries(session) -> None:
+    """Retry throttled and failed Sheets API requests with exponential backoff.
+
+    A 429 means Google rejected the request before applying it, so it is
+    retried for every method, appends included. Server errors are retried
+    only for idempotent methods, where repeating the request is harmless.
+    A Retry-After header from the API takes precedence over the backoff.
+    When the attempts run out the last response is returned unchanged, so
+    gspread raises its usual APIError.
+
+    Args:
+        session: HTTP session of the gspread client.
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    class SheetsRetry(Retry):
+        def is_retry(self, method, status_code, has_retry_after=False):
+            if status_code == 429:
+                return True
+            return super().is_retry(method, status_code, has_retry_after)
+
+        def increment(self, method=None, url=None, response=None, *args, **kwargs):
+            retry = super().increment(method, url, response, *args, **kwargs)
+            if response is not None:
+                logger.warning(
+                    "Sheets API returned %s for %s, backing off %.1fs",
+                    response.status,
+                    method,
+                    retry.get_backoff_time(),
+                )
+            return retry
+
+    retry = SheetsRetry(
+        total=RETRY_ATTEMPTS - 1,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=MAX_CONNECTIONS,
+            pool_maxsize=MAX_CONNECTIONS,
+            max_retries=retry,
+        ),
+    )
+
+
+def _backend_error_types() -> Tuple[type, ...]:
+    """Return the gspread, HTTP and Google auth base exception classes.
+
+    The imports run only once an exception is being matched, so importing
+    this module does not load gspread.
+    """
+    from google.auth.exceptions import GoogleAuthError
+    from gspread.exceptions import GSpreadException
+    from requests import RequestException
+
+    return (GSpreadException, RequestException, GoogleAuthError)
+
+
+def _wrap_backend_errors(func: Callable) -> Callable:
+    """Re-raise gspread, HTTP and auth errors from func as SheetsBackendError.
+
+    Callers then only need to handle this package's own exceptions.
+    Generator functions are wrapped so errors raised while iterating are
+    translated too.
+    """
+    if inspect.isgeneratorfunction(func):
+
+        @wraps(func)
+        def generator_wrapper(*args, **kwargs):
+            try:
+                yield from func(*args, **kwargs)
+            except _backend_error_types() as e:
+                raise SheetsBackendError(str(e)) from e
+
+        return generator_wrapper
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except _backend_error_types() as e:
+            raise SheetsBackendError(str(e)) from e
+
+    return wrapper
+
+
+def _is_stale_handle_error(error: Exception) -> bool:
+    """Tell whether an error may come from an outdated spreadsheet or tab handle.
+
+    Errors from public helpers such as ensure_worksheet_exists arrive
+    already wrapped in SheetsBackendError, so the original cause is checked.
+    """
+    if isinstance(error, SheetsBackendError) and error.__cause__ is not None:
+        error = error.__cause__
+    exceptions = _gspread().exceptions
+    if isinstance(error, exceptions.WorksheetNotFound):
+        return True
+    return (
+        isinstance(error, exceptions.APIError)
+        and getattr(error.response, "status_code", None) in STALE_HANDLE_STATUSES
+    )
+
+
+def _retry_with_fresh_handles(func: Callable) -> Callable:
+    """Retry a SheetsManager call once after dropping its sheet's cached handles.
+
+    Spreadsheet and worksheet handles are cached for the life of the
+    process. If a tutor deletes or renames a tab or stops sharing the sheet,
+    the cached handle starts failing; the retry reopens the spreadsheet and
+    recreates missing tabs, or reports the sheet as not found. Other errors,
+    such as a 400 for a bad range or value, are raised without a retry. The
+    wrapped method must take the sheet ID as its first argument. The
+    statuses that trigger a retry are rejected requests, so nothing is
+    written twice.
+    """
+
+    @wraps(func)
+    def wrapper(self, sheet_id, *args, **kwargs):
+        try:
+            return func(self, sheet_id, *args, **kwargs)
+        except (SheetsBackendError,) + _backend_error_types() as e:
+            if not _is_stale_handle_error(e):
+                raise
+            logger.info(
+                "Request for sheet %s failed (%s), retrying with fresh handles",
+                sheet_id,
+                e,
+            )
+            self.invalidate(sheet_id)
+            return func(self, sheet_id, *args, **kwargs)
+
+    return wrapper
+
+
+def _is_already_exists(error: Exception) -> bool:
+    """Tell whether an API error was caused by a sheet name already in use."""
+    return "already exists" in str(error)
+
+
+_managers: Dict[str, "SheetsManager"] = {}
+_managers_lock = threading.Lock()
+
+
+def get_sheets_manager(
+    credentials_path: str = "credentials.json",
+) -> "SheetsManager":
+    """Return the shared manager for a credentials file, creating it once.
+
+    The manager's client keeps one authorized session whose token is
+    refreshed by google-auth shortly before it expires, so reusing it saves
+    the JWT signing and token exchange on every bot action.
+
+    Args:
+        credentials_path: Path to Google service account credentials JSON file.
+
+    Returns:
+        SheetsManager bound to the given credentials.
+
+    Raises:
+        AuthenticationError: If credentials file is not found or invalid.
+    """
+    key = os.path.abspath(credentials_path)
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = _managers[key] = SheetsManager(credentials_path)
+        return manager
 
 
 class SheetsManager:
-    """Manager for Google Sheets operations."""
+    """Manager for Google Sheets operations.
+
+    Public methods raise gspread, HTTP and Google auth failures as
+    SheetsBackendError, so callers do not depend on gspread's exceptions.
+    """
 
     def __init__(self, credentials_path: str = "credentials.json"):
         """Initialize sheets manager with credentials.
@@ -48,14 +286,19 @@ class SheetsManager:
             )
 
         try:
-            self.credentials = ServiceAccountCredentials.from_json_keyfile_name(
-                credentials_path, scopes=SCOPES
-            )
-            self.client = gspread.authorize(self.credentials)
-        except (IOError, json.JSONDecodeError, ValueError) as e:
+            self.credentials = _credentials(os.path.abspath(credentials_path))
+            self.client = _gspread().authorize(self.credentials)
+            _mount_retries(self.client.session)
+        except (IOError, json.JSONDecodeError, ValueError, KeyError) as e:
             raise AuthenticationError(f"Failed to authenticate: {str(e)}")
 
-    def open_spreadsheet(self, sheet_id: str) -> gspread.Spreadsheet:
+        self._ss_cache: Dict[str, "gspread.Spreadsheet"] = {}
+        self._ws_cache: Dict[Tuple[str, str], "gspread.Worksheet"] = {}
+        self._settings_cache: Dict[str, Tuple[float, Dict[str, Optional[str]]]] = {}
+        self._rows_cache: Dict[Tuple[str, str], Tuple[float, Optional[str], list]] = {}
+
+    @_wrap_backend_errors
+    def open_spreadsheet(self, sheet_id: str) -> "gspread.Spreadsheet":
         """Open a spreadsheet by ID.
 
         Args:
@@ -67,16 +310,136 @@ class SheetsManager:
         Raises:
             SheetNotFoundError: If spreadsheet cannot be opened.
         """
+        spreadsheet = self._ss_cache.get(sheet_id)
+        if spreadsheet is not None:
+            return spreadsheet
+
         try:
-            return self.client.open_by_key(sheet_id)
-        except gspread.exceptions.SpreadsheetNotFound:
+            spreadsheet = self.client.open_by_key(sheet_id)
+        except _gspread().exceptions.SpreadsheetNotFound:
             raise SheetNotFoundError(f"Spreadsheet with ID {sheet_id} not found")
         except Exception as e:
             raise SheetNotFoundError(f"Failed to open spreadsheet: {str(e)}")
 
+        self._ss_cache[sheet_id] = spreadsheet
+        return spreadsheet
+
+    def warm_up(self) -> None:
+        """Fetch an access token before the first Sheets request needs it.
+
+        Without this the first user request pays for the OAuth token
+        exchange. Failures are only logged; the token is then fetched
+        lazily as before.
+        """
+        from google.auth.exceptions import GoogleAuthError
+        from google.auth.transport.requests import Request
+        from requests import RequestException
+
+        try:
+            self.credentials.refresh(Request())
+        except (GoogleAuthError, RequestException) as e:
+            logger.warning("Could not pre-fetch Sheets access token: %s", e)
+        else:
+            logger.info("Sheets access token fetched")
+
+    def invalidate(self, sheet_id: Optional[str] = None) -> None:
+        """Drop cached spreadsheet handles, worksheet handles, rows and settings.
+
+        Args:
+            sheet_id: Google Sheets ID to forget, or None to clear everything.
+        """
+        if sheet_id is None:
+            self._ss_cache.clear()
+            self._ws_cache.clear()
+            self._settings_cache.clear()
+            self._rows_cache.clear()
+            return
+
+        self._ss_cache.pop(sheet_id, None)
+        self._settings_cache.pop(sheet_id, None)
+        # Other I/O threads add entries while this runs, so iterate over a
+        # snapshot of the keys (list() copies atomically) and tolerate keys
+        # that were dropped in the meantime.
+        for cache in (self._ws_cache, self._rows_cache):
+            for key in list(cache):
+                if key[0] == sheet_id:
+                    cache.pop(key, None)
+
+    def _cached_rows(
+        self,
+        sheet_id: str,
+        worksheet_name: str,
+        iterate: Callable[[str, bool], Iterator[Any]],
+        strict: bool,
+    ) -> list:
+        """Return parsed worksheet rows, re-reading only if the file changed.
+
+        Within ROWS_CACHE_TTL seconds of the last check the cached rows are
+        returned as is. After that the spreadsheet's Drive modifiedTime is
+        probed, which is much cheaper than re-reading the worksheet, and the
+        rows are loaded again only when it has moved. Strict reads always go
+        to the sheet so that malformed rows are reported.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            worksheet_name: Name of the worksheet.
+            iterate: Reader such as iter_students.
+            strict: Raise on the first malformed row instead of skipping it.
+
+        Returns:
+            A new list of copies of the parsed objects, so callers may
+            modify them without touching the cache.
+        """
+        if strict:
+            return list(iterate(sheet_id, True))
+
+        key = (sheet_id, worksheet_name)
+        entry = self._rows_cache.get(key)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ROWS_CACHE_TTL:
+            return [copy.copy(item) for item in entry[2]]
+
+        try:
+            revision = self.open_spreadsheet(sheet_id).get_lastUpdateTime()
+        except Exception:
+            revision = None
+
+        if entry is not None and revision is not None and entry[1] == revision:
+            self._rows_cache[key] = (now, revision, entry[2])
+            return [copy.copy(item) for item in entry[2]]
+
+        items = list(iterate(sheet_id, False))
+        self._rows_cache[key] = (now, revision, items)
+        return [copy.copy(item) for item in items]
+
+    def _get_worksheet(
+        self, sheet_id: str, worksheet_name: str
+    ) -> "gspread.Worksheet":
+        """Get a worksheet handle, opening and creating it only on first use.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            worksheet_name: Name of the worksheet.
+
+        Returns:
+            gspread Worksheet object.
+
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If worksheet cannot be created.
+        """
+        key = (sheet_id, worksheet_name)
+        worksheet = self._ws_cache.get(key)
+        if worksheet is None:
+            spreadsheet = self.open_spreadsheet(sheet_id)
+            worksheet = self.ensure_worksheet_exists(spreadsheet, worksheet_name)
+            self._ws_cache[key] = worksheet
+        return worksheet
+
+    @_wrap_backend_errors
     def ensure_worksheet_exists(
-        self, spreadsheet: gspread.Spreadsheet, worksheet_name: str
-    ) -> gspread.Worksheet:
+        self, spreadsheet: "gspread.Spreadsheet", worksheet_name: str
+    ) -> "gspread.Worksheet":
         """Ensure a worksheet exists, creating it if necessary.
 
         Args:
@@ -91,44 +454,166 @@ class SheetsManager:
         """
         try:
             worksheet = spreadsheet.worksheet(worksheet_name)
-        except gspread.exceptions.WorksheetNotFound:
+        except _gspread().exceptions.WorksheetNotFound:
             try:
                 worksheet = spreadsheet.add_worksheet(
                     title=worksheet_name, rows=1000, cols=26
                 )
-                headers = WORKSHEET_HEADERS.get(worksheet_name, [])
-                if headers:
-                    worksheet.append_row(headers)
+                if worksheet_name in WORKSHEET_HEADERS:
+                    worksheet.append_row(list(WORKSHEET_HEADERS[worksheet_name]))
             except Exception as e:
+                if _is_already_exists(e):
+                    # Created concurrently by another request.
+                    return spreadsheet.worksheet(worksheet_name)
                 raise WorksheetNotFoundError(
                     f"Failed to create worksheet {worksheet_name}: {str(e)}"
                 )
 
         return worksheet
 
+    @_wrap_backend_errors
     def ensure_all_worksheets(
-        self, spreadsheet: gspread.Spreadsheet
-    ) -> Dict[str, gspread.Worksheet]:
+        self, spreadsheet: "gspread.Spreadsheet"
+    ) -> Dict[str, "gspread.Worksheet"]:
         """Ensure all required worksheets exist.
 
+        Missing worksheets are created with one batchUpdate request and their
+        headers are written with one values.batchUpdate request. If a tab was
+        added by someone else in the meantime the tabs are listed again once;
+        if the batch is rejected otherwise, the worksheets are created
+        concurrently one by one.
+
         Args:
             spreadsheet: gspread Spreadsheet object.
 
         Returns:
             Dictionary mapping worksheet names to worksheet objects.
+
+        Raises:
+            WorksheetNotFoundError: If missing worksheets cannot be created.
         """
+        from gspread.utils import absolute_range_name
+
+        for attempt in range(2):
+            existing = {
+                worksheet.title: worksheet for worksheet in spreadsheet.worksheets()
+            }
+            missing = [name for name in _WORKSHEET_NAMES if name not in existing]
+            if not missing:
+                break
+
+            try:
+                existing.update(self._add_worksheets(spreadsheet, missing))
+            except Exception as e:
+                if attempt == 0 and _is_already_exists(e):
+                    # Another request added some of the tabs after we listed
+                    # them; list again and add only what is still missing.
+                    continue
+                logger.warning(
+                    "Batched creation of %s failed (%s), creating them one by one",
+                    ", ".join(missing),
+                    e,
+                )
+                existing.update(
+                    self._create_worksheets_concurrently(spreadsheet, missing)
+                )
+                missing = []
+            break
+
+        header_data = [
+            {
+                "range": absolute_range_name(name, "A1"),
+                "values": [list(WORKSHEET_HEADERS[name])],
+            }
+            for name in missing
+            if WORKSHEET_HEADERS[name]
+        ]
+        if header_data:
+            try:
+                spreadsheet.values_batch_update(
+                    body={"valueInputOption": "RAW", "data": header_data}
+                )
+            except Exception as e:
+                raise WorksheetNotFoundError(
+                    f"Failed to create worksheets {', '.join(missing)}: {str(e)}"
+                )
+
         worksheets = {}
-        for worksheet_name in WORKSHEET_HEADERS.keys():
-            worksheets[worksheet_name] = self.ensure_worksheet_exists(
-                spreadsheet, worksheet_name
-            )
+        for worksheet_name in _WORKSHEET_NAMES:
+            worksheets[worksheet_name] = existing[worksheet_name]
+            self._ws_cache[(spreadsheet.id, worksheet_name)] = existing[worksheet_name]
         return worksheets
 
-    def get_all_students(self, sheet_id: str) -> List[Student]:
+    def _add_worksheets(
+        self, spreadsheet: "gspread.Spreadsheet", names: List[str]
+    ) -> Dict[str, "gspread.Worksheet"]:
+        """Add several worksheets with a single batchUpdate request.
+
+        Args:
+            spreadsheet: gspread Spreadsheet object.
+            names: Worksheet names to add.
+
+        Returns:
+            Dictionary mapping worksheet names to the new worksheet objects.
+        """
+        response = spreadsheet.batch_update(
+            {
+                "requests": [
+                    {
+                        "addSheet": {
+                            "properties": {
+                                "title": name,
+                                "gridProperties": {
+                                    "rowCount": 1000,
+                                    "columnCount": 26,
+                                },
+                            }
+                        }
+                    }
+                    for name in names
+                ]
+            }
+        )
+        worksheet_cls = _gspread().Worksheet
+        created = {}
+        for reply in response["replies"]:
+            properties = reply["addSheet"]["properties"]
+            created[properties["title"]] = worksheet_cls(spreadsheet, properties)
+        return created
+
+    def _create_worksheets_concurrently(
+        self, spreadsheet: "gspread.Spreadsheet", names: List[str]
+    ) -> Dict[str, "gspread.Worksheet"]:
+        """Create worksheets with their headers in parallel threads.
+
+        Used when the batched addSheet request is rejected, e.g. because one
+        of the tabs was created in the meantime. Each tab costs two calls, so
+        the wall time is that of the slowest tab rather than the sum.
+
+        Args:
+            spreadsheet: gspread Spreadsheet object.
+            names: Worksheet names to create.
+
+        Returns:
+            Dictionary mapping worksheet names to worksheet objects.
+
+        Raises:
+            WorksheetNotFoundError: If a worksheet cannot be created.
+        """
+        create = partial(self.ensure_worksheet_exists, spreadsheet)
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            return dict(zip(names, executor.map(create, names)))
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def get_all_students(
+        self, sheet_id: str, strict: bool = False
+    ) -> List[Student]:
         """Get all students from the spreadsheet.
 
         Args:
             sheet_id: Google Sheets ID.
+            strict: Raise on the first malformed row instead of skipping it.
 
         Returns:
             List of Student objects.
@@ -136,32 +621,44 @@ class SheetsManager:
         Raises:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Ученики worksheet is not found.
-            MalformedDataError: If student data is invalid.
+            MalformedDataError: If student data is invalid and strict is set.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Ученики")
+        return self._cached_rows(sheet_id, "Ученики", self.iter_students, strict)
 
-        students = []
-        rows = worksheet.get_all_values()
+    @_wrap_backend_errors
+    def iter_students(
+        self, sheet_id: str, strict: bool = False
+    ) -> Iterator[Student]:
+        """Iterate over students in the spreadsheet, fetching rows page by page.
 
-        for idx, row in enumerate(rows[1:], start=2):
-            if not row or not row[0]:
-                continue
-            try:
-                student = Student.from_row(row, sheet_row=idx)
-                students.append(student)
-            except (IndexError, ValueError) as e:
-                raise MalformedDataError(
-                    f"Invalid student data at row {idx}: {str(e)}"
-                )
+        Malformed rows are skipped and reported in a single warning once the
+        sheet has been read, unless strict is set.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            strict: Raise on the first malformed row instead of skipping it.
 
-        return students
+        Yields:
+            Student objects in sheet order.
 
-    def get_all_lessons(self, sheet_id: str) -> List[Lesson]:
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Ученики worksheet is not found.
+            MalformedDataError: If student data is invalid and strict is set.
+        """
+        worksheet = self._get_worksheet(sheet_id, "Ученики")
+        yield from self._parse_rows(worksheet, Student.from_row, "student", strict)
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def get_all_lessons(
+        self, sheet_id: str, strict: bool = False
+    ) -> List[Lesson]:
         """Get all lessons from the spreadsheet.
 
         Args:
             sheet_id: Google Sheets ID.
+            strict: Raise on the first malformed row instead of skipping it.
 
         Returns:
             List of Lesson objects.
@@ -169,30 +666,44 @@ class SheetsManager:
         Raises:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Уроки worksheet is not found.
-            MalformedDataError: If lesson data is invalid.
+            MalformedDataError: If lesson data is invalid and strict is set.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Уроки")
+        return self._cached_rows(sheet_id, "Уроки", self.iter_lessons, strict)
 
-        lessons = []
-        rows = worksheet.get_all_values()
+    @_wrap_backend_errors
+    def iter_lessons(
+        self, sheet_id: str, strict: bool = False
+    ) -> Iterator[Lesson]:
+        """Iterate over lessons in the spreadsheet, fetching rows page by page.
 
-        for idx, row in enumerate(rows[1:], start=2):
-            if not row or not row[0]:
-                continue
-            try:
-                lesson = Lesson.from_row(row, sheet_row=idx)
-                lessons.append(lesson)
-            except (IndexError, ValueError) as e:
-                raise MalformedDataError(f"Invalid lesson data at row {idx}: {str(e)}")
+        Malformed rows are skipped and reported in a single warning once the
+        sheet has been read, unless strict is set.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            strict: Raise on the first malformed row instead of skipping it.
 
-        return lessons
+        Yields:
+            Lesson objects in sheet order.
 
-    def get_all_payments(self, sheet_id: str) -> List[Payment]:
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Уроки worksheet is not found.
+            MalformedDataError: If lesson data is invalid and strict is set.
+        """
+        worksheet = self._get_worksheet(sheet_id, "Уроки")
+        yield from self._parse_rows(worksheet, Lesson.from_row, "lesson", strict)
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def get_all_payments(
+        self, sheet_id: str, strict: bool = False
+    ) -> List[Payment]:
         """Get all payments from the spreadsheet.
 
         Args:
             sheet_id: Google Sheets ID.
+            strict: Raise on the first malformed row instead of skipping it.
 
         Returns:
             List of Payment objects.
@@ -200,27 +711,100 @@ class SheetsManager:
         Raises:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Платежи worksheet is not found.
-            MalformedDataError: If payment data is invalid.
+            MalformedDataError: If payment data is invalid and strict is set.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Платежи")
+        return self._cached_rows(sheet_id, "Платежи", self.iter_payments, strict)
 
-        payments = []
-        rows = worksheet.get_all_values()
+    @_wrap_backend_errors
+    def iter_payments(
+        self, sheet_id: str, strict: bool = False
+    ) -> Iterator[Payment]:
+        """Iterate over payments in the spreadsheet, fetching rows page by page.
 
-        for idx, row in enumerate(rows[1:], start=2):
+        Malformed rows are skipped and reported in a single warning once the
+        sheet has been read, unless strict is set.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            strict: Raise on the first malformed row instead of skipping it.
+
+        Yields:
+            Payment objects in sheet order.
+
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Платежи worksheet is not found.
+            MalformedDataError: If payment data is invalid and strict is set.
+        """
+        worksheet = self._get_worksheet(sheet_id, "Платежи")
+        yield from self._parse_rows(worksheet, Payment.from_row, "payment", strict)
+
+    def _parse_rows(
+        self,
+        worksheet: "gspread.Worksheet",
+        parse: Callable[[List[str], int], Any],
+        kind: str,
+        strict: bool,
+    ) -> Iterator[Any]:
+        """Parse non-blank data rows of a worksheet into model objects.
+
+        Args:
+            worksheet: Worksheet to read.
+            parse: Model ``from_row`` constructor.
+            kind: Record name used in error messages.
+            strict: Raise on the first malformed row instead of skipping it.
+
+        Yields:
+            Parsed model objects in sheet order.
+
+        Raises:
+            MalformedDataError: If a row is invalid and strict is set.
+        """
+        errors = []
+        for idx, row in self._iter_rows(worksheet):
             if not row or not row[0]:
                 continue
             try:
-                payment = Payment.from_row(row, sheet_row=idx)
-                payments.append(payment)
+                yield parse(row, idx)
             except (IndexError, ValueError) as e:
-                raise MalformedDataError(
-                    f"Invalid payment data at row {idx}: {str(e)}"
-                )
+                if strict:
+                    raise MalformedDataError(
+                        f"Invalid {kind} data at row {idx}: {str(e)}"
+                    )
+                errors.append((idx, str(e)))
+
+        if errors:
+            logger.warning(
+                "Skipped %d invalid %s row(s) in %s: %s",
+                len(errors),
+                kind,
+                worksheet.title,
+                "; ".join(f"row {idx}: {err}" for idx, err in errors),
+            )
 
-        return payments
+    def _iter_rows(
+        self, worksheet: "gspread.Worksheet", start: int = 2
+    ) -> Iterator[Tuple[int, List[str]]]:
+        """Yield worksheet rows below the header from a single request.
 
+        The open-ended range reads to the last non-empty row however large
+        the grid is. The API trims only trailing empty rows, so blank rows
+        in the middle of the sheet come back as empty lists and the row
+        numbers stay aligned. Rows are handed out one at a time so callers
+        parse them lazily.
+
+        Args:
+            worksheet: gspread Worksheet object.
+            start: First row number to read.
+
+        Yields:
+            Tuples of (sheet_row, row values).
+        """
+        rows = worksheet.get(f"A{start}:Z")
+        for offset, row in enumerate(rows):
+            yield start + offset, row
+
+    @_wrap_backend_errors
     def add_student(self, sheet_id: str, student: Student) -> None:
         """Add a student to the spreadsheet.
 
@@ -232,10 +816,9 @@ class SheetsManager:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Ученики worksheet is not found.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Ученики")
-        worksheet.append_row(student.to_row())
+        self.add_students_bulk(sheet_id, [student])
 
+    @_wrap_backend_errors
     def add_lesson(self, sheet_id: str, lesson: Lesson) -> None:
         """Add a lesson to the spreadsheet.
 
@@ -247,10 +830,9 @@ class SheetsManager:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Уроки worksheet is not found.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Уроки")
-        worksheet.append_row(lesson.to_row())
+        self.add_lessons_bulk(sheet_id, [lesson])
 
+    @_wrap_backend_errors
     def add_payment(self, sheet_id: str, payment: Payment) -> None:
         """Add a payment to the spreadsheet.
 
@@ -262,10 +844,78 @@ class SheetsManager:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Платежи worksheet is not found.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Платежи")
-        worksheet.append_row(payment.to_row())
+        self.add_payments_bulk(sheet_id, [payment])
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def add_students_bulk(self, sheet_id: str, students: List[Student]) -> None:
+        """Add several students to the spreadsheet in a single API call.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            students: Student objects to add.
+
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Ученики worksheet is not found.
+        """
+        self._append_rows(
+            sheet_id, "Ученики", [student.to_row() for student in students]
+        )
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def add_lessons_bulk(self, sheet_id: str, lessons: List[Lesson]) -> None:
+        """Add several lessons to the spreadsheet in a single API call.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            lessons: Lesson objects to add.
+
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Уроки worksheet is not found.
+        """
+        self._append_rows(
+            sheet_id, "Уроки", [lesson.to_row() for lesson in lessons]
+        )
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def add_payments_bulk(self, sheet_id: str, payments: List[Payment]) -> None:
+        """Add several payments to the spreadsheet in a single API call.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            payments: Payment objects to add.
+
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Платежи worksheet is not found.
+        """
+        self._append_rows(
+            sheet_id, "Платежи", [payment.to_row() for payment in payments]
+        )
 
+    def _append_rows(
+        self, sheet_id: str, worksheet_name: str, rows: List[List[str]]
+    ) -> None:
+        """Append rows to a worksheet with one values.append request.
+
+        Args:
+            sheet_id: Google Sheets ID.
+            worksheet_name: Name of the worksheet.
+            rows: Rows to append.
+        """
+        if not rows:
+            return
+
+        worksheet = self._get_worksheet(sheet_id, worksheet_name)
+        worksheet.append_rows(rows, insert_data_option="INSERT_ROWS")
+        self._rows_cache.pop((sheet_id, worksheet_name), None)
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def log_event(self, sheet_id: str, event: str, detail: str = "") -> None:
         """Log an event to the История worksheet.
 
@@ -280,10 +930,11 @@ class SheetsManager:
         """
         from datetime import datetime
 
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "История")
+        worksheet = self._get_worksheet(sheet_id, "История")
         worksheet.append_row([datetime.now().isoformat(), event, detail])
 
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def get_setting(self, sheet_id: str, key: str) -> Optional[str]:
         """Get a setting value from Настройки worksheet.
 
@@ -298,16 +949,31 @@ class SheetsManager:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Настройки worksheet is not found.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Настройки")
-        rows = worksheet.get_all_values()
+        return self._read_settings(sheet_id).get(key)
 
-        for row in rows[1:]:
-            if row and len(row) > 0 and row[0] == key:
-                return row[1] if len(row) > 1 else None
+    def _read_settings(self, sheet_id: str) -> Dict[str, Optional[str]]:
+        """Read the key/value columns of Настройки, cached for SETTINGS_CACHE_TTL.
 
-        return None
+        Args:
+            sheet_id: Google Sheets ID.
+
+        Returns:
+            Dictionary mapping setting keys to values.
+        """
+        cached = self._settings_cache.get(sheet_id)
+        if cached is not None and time.monotonic() - cached[0] < SETTINGS_CACHE_TTL:
+            return cached[1]
 
+        worksheet = self._get_worksheet(sheet_id, "Настройки")
+        settings: Dict[str, Optional[str]] = {}
+        for row in worksheet.get("A2:B"):
+            if row and row[0] not in settings:
+                settings[row[0]] = row[1] if len(row) > 1 else None
+
+        self._settings_cache[sheet_id] = (time.monotonic(), settings)
+        return settings
+
+    @_wrap_backend_errors
     def set_setting(self, sheet_id: str, key: str, value: str) -> None:
         """Set or update a setting in Настройки worksheet.
 
@@ -320,17 +986,67 @@ class SheetsManager:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Настройки worksheet is not found.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Настройки")
-        rows = worksheet.get_all_values()
+        self.set_settings(sheet_id, {key: value})
 
-        for idx, row in enumerate(rows[1:], start=2):
-            if row and len(row) > 0 and row[0] == key:
-                worksheet.update_cell(idx, 2, value)
-                return
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
+    def set_settings(self, sheet_id: str, items: Dict[str, str]) -> None:
+        """Set or update several settings in Настройки worksheet at once.
 
-        worksheet.append_row([key, value])
+        Column A is read once; existing keys are rewritten with a single
+        values.batchUpdate request and new keys are added with a single
+        append request.
 
+        Args:
+            sheet_id: Google Sheets ID.
+            items: Mapping of setting keys to values.
+
+        Raises:
+            SheetNotFoundError: If spreadsheet cannot be opened.
+            WorksheetNotFoundError: If Настройки worksheet is not found.
+        """
+        if not items:
+            return
+
+        from gspread.utils import absolute_range_name
+
+        worksheet = self._get_worksheet(sheet_id, "Настройки")
+        keys = worksheet.col_values(1)
+
+        rows_by_key: Dict[str, int] = {}
+        for idx, existing_key in enumerate(keys[1:], start=2):
+            if existing_key and existing_key not in rows_by_key:
+                rows_by_key[existing_key] = idx
+
+        updates = []
+        appends = []
+        for key, value in items.items():
+            row = rows_by_key.get(key)
+            if row is None:
+                appends.append([key, value])
+            else:
+                updates.append(
+                    {
+                        "range": absolute_range_name("Настройки", f"A{row}:B{row}"),
+                        "values": [[key, value]],
+                    }
+                )
+
+        # Drop cached settings only after the writes, so a concurrent read
+        # cannot repopulate the cache with the old values; a failed write
+        # may still have applied its first request, so invalidate anyway.
+        try:
+            if updates:
+                self.open_spreadsheet(sheet_id).values_batch_update(
+                    body={"valueInputOption": "USER_ENTERED", "data": updates}
+                )
+            if appends:
+                worksheet.append_rows(appends)
+        finally:
+            self._settings_cache.pop(sheet_id, None)
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def update_student(self, sheet_id: str, student: Student) -> None:
         """Update a student record.
 
@@ -346,13 +1062,10 @@ class SheetsManager:
         if student.sheet_row is None:
             raise ValueError("sheet_row must be set for update operations")
 
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Ученики")
-        row_data = student.to_row()
-
-        for col_idx, value in enumerate(row_data, start=1):
-            worksheet.update_cell(student.sheet_row, col_idx, value)
+        self._update_row(sheet_id, "Ученики", student.sheet_row, student.to_row())
 
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def update_lesson(self, sheet_id: str, lesson: Lesson) -> None:
         """Update a lesson record.
 
@@ -368,13 +1081,10 @@ class SheetsManager:
         if lesson.sheet_row is None:
             raise ValueError("sheet_row must be set for update operations")
 
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Уроки")
-        row_data = lesson.to_row()
-
-        for col_idx, value in enumerate(row_data, start=1):
-            worksheet.update_cell(lesson.sheet_row, col_idx, value)
+        self._update_row(sheet_id, "Уроки", lesson.sheet_row, lesson.to_row())
 
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def update_payment(self, sheet_id: str, payment: Payment) -> None:
         """Update a payment record.
 
@@ -390,13 +1100,32 @@ class SheetsManager:
         if payment.sheet_row is None:
             raise ValueError("sheet_row must be set for update operations")
 
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Платежи")
-        row_data = payment.to_row()
+        self._update_row(sheet_id, "Платежи", payment.sheet_row, payment.to_row())
 
-        for col_idx, value in enumerate(row_data, start=1):
-            worksheet.update_cell(payment.sheet_row, col_idx, value)
+    def _update_row(
+        self, sheet_id: str, worksheet_name: str, sheet_row: int, row_data: List[str]
+    ) -> None:
+        """Overwrite one worksheet row with a single values.update request.
 
+        Args:
+            sheet_id: Google Sheets ID.
+            worksheet_name: Name of the worksheet.
+            sheet_row: 1-based row number to overwrite.
+            row_data: Cell values for the row, starting at column A.
+        """
+        worksheet = self._get_worksheet(sheet_id, worksheet_name)
+        from gspread.utils import rowcol_to_a1
+
+        end_cell = rowcol_to_a1(sheet_row, len(row_data))
+        worksheet.update(
+            f"A{sheet_row}:{end_cell}",
+            [row_data],
+            value_input_option="USER_ENTERED",
+        )
+        self._rows_cache.pop((sheet_id, worksheet_name), None)
+
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def get_student_records(self, sheet_id: str) -> List[StudentRecord]:
         """Get all student records from the Ученики worksheet.
 
@@ -411,8 +1140,11 @@ class SheetsManager:
             WorksheetNotFoundError: If Ученики worksheet is not found.
             MalformedDataError: If student data is invalid.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Ученики")
+        return self._read_student_records(sheet_id)
+
+    def _read_student_records(self, sheet_id: str) -> List[StudentRecord]:
+        """Read and parse the Ученики worksheet without retrying."""
+        worksheet = self._get_worksheet(sheet_id, "Ученики")
 
         records = []
         rows = worksheet.get_all_values()
@@ -430,6 +1162,8 @@ class SheetsManager:
 
         return records
 
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def add_student_record(
         self, sheet_id: str, parent_name: str, student_name: str, lesson_cost: str
     ) -> StudentRecord:
@@ -450,7 +1184,7 @@ class SheetsManager:
             ValueError: If student record already exists (same parent/student pair).
         """
         # Get existing records to check for duplicates
-        existing_records = self.get_student_records(sheet_id)
+        existing_records = self._read_student_records(sheet_id)
         parent_lower = parent_name.lower().strip()
         student_lower = student_name.lower().strip()
 
@@ -464,8 +1198,7 @@ class SheetsManager:
                 )
 
         # Add the new record
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Ученики")
+        worksheet = self._get_worksheet(sheet_id, "Ученики")
 
         student_record = StudentRecord(
             parent_name=parent_name,
@@ -474,9 +1207,12 @@ class SheetsManager:
         )
 
         worksheet.append_row(student_record.to_row())
+        self._rows_cache.pop((sheet_id, "Ученики"), None)
 
         return student_record
 
+    @_wrap_backend_errors
+    @_retry_with_fresh_handles
     def delete_student_record(self, sheet_id: str, parent_name: str, student_name: str) -> bool:
         """Delete a student record by parent/student name pair (case-insensitive).
 
@@ -492,8 +1228,7 @@ class SheetsManager:
             SheetNotFoundError: If spreadsheet cannot be opened.
             WorksheetNotFoundError: If Ученики worksheet is not found.
         """
-        spreadsheet = self.open_spreadsheet(sheet_id)
-        worksheet = self.ensure_worksheet_exists(spreadsheet, "Ученики")
+        worksheet = self._get_worksheet(sheet_id, "Ученики")
 
         rows = worksheet.get_all_values()
         parent_lower = parent_name.lower().strip()
@@ -507,6 +1242,7 @@ class SheetsManager:
                 and row[1].lower().strip() == student_lower
             ):
                 worksheet.delete_rows(idx)
+                self._rows_cache.pop((sheet_id, "Ученики"), None)
                 return True
 
         return False
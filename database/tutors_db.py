@@ -2,14 +2,38 @@
 
 import json
 import os
+import time
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from threading import Lock
 from datetime import datetime
 
 from .exceptions import TutorNotFoundError, TutorAlreadyExistsError, ConfigurationError
 from utils.models import TutorConfig
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+TUTOR_CACHE_TTL = 30.0
+
+TUTOR_CACHE_MAX_SIZE = 4096
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 class TutorsDB:
     """Thread-safe manager for tutors configuration."""
@@ -17,12 +41,24 @@ class TutorsDB:
     def __init__(self, db_path: str = "tutors_config.json"):
         """Initialize tutors database.
 
+        The file is parsed and indexed here, so the first lookup is served
+        from memory like every later one.
+
         Args:
             db_path: Path to tutors_config.json file.
+
+        Raises:
+            ConfigurationError: If the database file cannot be read or parsed.
         """
         self.db_path = db_path
         self._lock = Lock()
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._tutor_cache: Dict[str, Tuple[float, Optional[TutorConfig]]] = {}
         self._ensure_db_exists()
+        if self._cache is None:
+            self._read_db()
 
     def _ensure_db_exists(self) -> None:
         """Ensure database file exists with proper structure."""
@@ -40,6 +76,9 @@ class TutorsDB:
     def _read_db(self) -> Dict[str, Any]:
         """Read database file with thread safety.
 
+        The parsed file is kept in memory and only re-read when its
+        modification time or size changes.
+
         Returns:
             Database dictionary.
 
@@ -47,10 +86,18 @@ class TutorsDB:
             ConfigurationError: If database file is invalid.
         """
         try:
-            with open(self.db_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            st = os.stat(self.db_path)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if self._cache is not None and cache_key == self._cache_key:
+                return self._cache
+
+            with open(self.db_path, "rb") as f:
+                data = _loads(f.read())
             if "tutors" not in data:
                 data["tutors"] = []
+            self._cache = data
+            self._cache_key = cache_key
+            self._reindex(data)
             return data
         except json.JSONDecodeError as e:
             raise ConfigurationError(f"Invalid JSON in {self.db_path}: {str(e)}")
@@ -60,18 +107,93 @@ class TutorsDB:
     def _write_db(self, data: Dict[str, Any]) -> None:
         """Write database file with thread safety.
 
+        The data is written to a temporary file next to the database and
+        moved into place with os.replace, so a crash mid-write never leaves
+        a truncated database behind.
+
         Args:
             data: Data to write.
 
         Raises:
             ConfigurationError: If write operation fails.
         """
+        tmp_path = self.db_path + ".tmp"
         try:
-            with open(self.db_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(data))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.db_path)
+            self._fsync_dir()
+            st = os.stat(self.db_path)
         except IOError as e:
+            self._cache = None
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             raise ConfigurationError(f"Failed to write {self.db_path}: {str(e)}")
 
+        self._cache = data
+        self._cache_key = (st.st_mtime_ns, st.st_size)
+        self._reindex(data)
+
+    def _fsync_dir(self) -> None:
+        """Flush the directory entry of the database file to disk (POSIX only)."""
+        if os.name != "posix":
+            return
+        dir_fd = os.open(os.path.dirname(os.path.abspath(self.db_path)), os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _reindex(self, data: Dict[str, Any]) -> None:
+        """Rebuild the telegram_id index over the cached tutor entries.
+
+        Lookup results cached by _lookup are dropped as well, since they may
+        no longer match the data.
+
+        Args:
+            data: Database dictionary the index should point into.
+        """
+        self._by_id = {
+            tutor.get("telegram_id"): tutor for tutor in data.get("tutors", [])
+        }
+        self._tutor_cache.clear()
+
+    def _lookup(self, telegram_id: str) -> Optional[TutorConfig]:
+        """Find a tutor, caching hits and misses for TUTOR_CACHE_TTL seconds.
+
+        Every bot update looks up its sender, so repeated lookups within the
+        TTL skip the file check and the TutorConfig construction. Misses are
+        cached too, so unregistered users do not hit the file on every
+        message. Any write through this instance clears the cache.
+
+        Cache hits are served without taking the lock, so lookups do not
+        wait behind a write that is busy syncing the file to disk.
+
+        Args:
+            telegram_id: Tutor's Telegram ID.
+
+        Returns:
+            TutorConfig object, or None if the tutor is not registered.
+        """
+        now = time.monotonic()
+        entry = self._tutor_cache.get(telegram_id)
+        if entry is not None and now - entry[0] < TUTOR_CACHE_TTL:
+            return entry[1]
+
+        with self._lock:
+            self._read_db()
+            tutor_data = self._by_id.get(telegram_id)
+            tutor = (
+                TutorConfig.from_dict(tutor_data) if tutor_data is not None else None
+            )
+
+            if len(self._tutor_cache) >= TUTOR_CACHE_MAX_SIZE:
+                self._tutor_cache.clear()
+            self._tutor_cache[telegram_id] = (now, tutor)
+            return tutor
+
     def register_tutor(
         self, telegram_id: str, name: str, sheets_id: str
     ) -> TutorConfig:
@@ -92,11 +214,10 @@ class TutorsDB:
         with self._lock:
             db_data = self._read_db()
 
-            for tutor in db_data.get("tutors", []):
-                if tutor.get("telegram_id") == telegram_id:
-                    raise TutorAlreadyExistsError(
-                        f"Tutor with telegram_id {telegram_id} already registered"
-                    )
+            if telegram_id in self._by_id:
+                raise TutorAlreadyExistsError(
+                    f"Tutor with telegram_id {telegram_id} already registered"
+                )
 
             now = datetime.now().isoformat()
             tutor_config = TutorConfig(
@@ -124,16 +245,10 @@ class TutorsDB:
         Raises:
             TutorNotFoundError: If tutor is not found.
         """
-        with self._lock:
-            db_data = self._read_db()
-
-            for tutor_data in db_data.get("tutors", []):
-                if tutor_data.get("telegram_id") == telegram_id:
-                    return TutorConfig.from_dict(tutor_data)
-
-            raise TutorNotFoundError(
-                f"Tutor with telegram_id {telegram_id} not found"
-            )
+        tutor = self._lookup(telegram_id)
+        if tutor is None:
+            raise TutorNotFoundError(f"Tutor with telegram_id {telegram_id} not found")
+        return tutor
 
     def update_tutor(self, telegram_id: str, **kwargs) -> TutorConfig:
         """Update tutor configuration.
@@ -152,21 +267,17 @@ class TutorsDB:
         with self._lock:
             db_data = self._read_db()
 
-            found = False
-            for tutor in db_data.get("tutors", []):
-                if tutor.get("telegram_id") == telegram_id:
-                    for key, value in kwargs.items():
-                        if key in ("name", "sheets_id"):
-                            tutor[key] = value
-                    tutor["updated_at"] = datetime.now().isoformat()
-                    found = True
-                    break
-
-            if not found:
+            tutor = self._by_id.get(telegram_id)
+            if tutor is None:
                 raise TutorNotFoundError(
                     f"Tutor with telegram_id {telegram_id} not found"
                 )
 
+            for key, value in kwargs.items():
+                if key in ("name", "sheets_id"):
+                    tutor[key] = value
+            tutor["updated_at"] = datetime.now().isoformat()
+
             self._write_db(db_data)
             return TutorConfig.from_dict(tutor)
 
@@ -183,18 +294,17 @@ class TutorsDB:
         with self._lock:
             db_data = self._read_db()
 
-            initial_length = len(db_data.get("tutors", []))
+            if telegram_id not in self._by_id:
+                raise TutorNotFoundError(
+                    f"Tutor with telegram_id {telegram_id} not found"
+                )
+
             db_data["tutors"] = [
                 t
                 for t in db_data.get("tutors", [])
                 if t.get("telegram_id") != telegram_id
             ]
 
-            if len(db_data["tutors"]) == initial_length:
-                raise TutorNotFoundError(
-                    f"Tutor with telegram_id {telegram_id} not found"
-                )
-
             self._write_db(db_data)
 
     def list_tutors(self) -> List[TutorConfig]:
@@ -218,8 +328,4 @@ class TutorsDB:
         Returns:
             True if tutor exists, False otherwise.
         """
-        try:
-            self.get_tutor(telegram_id)
-            return True
-        except TutorNotFoundError:
-            return False
+        return self._lookup(telegram_id) is not None
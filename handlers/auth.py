@@ -1,16 +1,18 @@
 """Authentication and registration handlers for the Telegram bot."""
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove
+from telegram import Update, ReplyKeyboardMarkup
 from telegram.ext import (
     ContextTypes,
     ConversationHandler,
     CommandHandler,
     MessageHandler,
-    filters,
 )
 
 import config
@@ -20,7 +22,14 @@ from database.exceptions import (
     TutorAlreadyExistsError,
     TutorNotFoundError,
     SheetNotFoundError,
-    WorksheetNotFoundError,
+)
+from handlers.common import (
+    KEYBOARD_REMOVE,
+    SHEETS_ERRORS,
+    TEXT_NOT_COMMAND,
+    invalid_input_reply,
+    message_text,
+    run_sheets,
 )
 from utils.messages import Messages
 from utils.validators import extract_sheet_id, validate_name, sanitize_name
@@ -30,9 +39,52 @@ logger = logging.getLogger(__name__)
 # Conversation states
 AWAITING_NAME, AWAITING_SHEET = range(2)
 
+# How long register_sheet reuses a sheet check, and how many it remembers
+SHEET_CHECK_TTL = 60.0
+SHEET_CHECK_FAILURE_TTL = 10.0
+SHEET_CHECK_CACHE_SIZE = 256
+
+# Reply keyboards offered by /start
+KEYBOARD_REGISTERED = ReplyKeyboardMarkup(
+    [["/profile"], ["/help"]], resize_keyboard=True, one_time_keyboard=False
+)
+KEYBOARD_NEW = ReplyKeyboardMarkup(
+    [["/register"], ["/help"]], resize_keyboard=True, one_time_keyboard=False
+)
+
+
+def _format_timestamp(value):
+    """Format a stored ISO timestamp as DD.MM.YYYY HH:MM for display.
+
+    Timestamps written by TutorsDB ("YYYY-MM-DDTHH:MM:SS...") are reformatted
+    by slicing, without building a datetime. Anything else goes through
+    datetime.fromisoformat, and unparsable strings are cut to the date part.
+    Non-string values are returned unchanged.
+    """
+    if isinstance(value, datetime):
+        return value.strftime("%d.%m.%Y %H:%M")
+    if not isinstance(value, str):
+        return value
+    if (
+        len(value) >= 16
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] in "T "
+        and value[13] == ":"
+    ):
+        return f"{value[8:10]}.{value[5:7]}.{value[:4]} {value[11:16]}"
+    try:
+        return datetime.fromisoformat(value).strftime("%d.%m.%Y %H:%M")
+    except ValueError:
+        return value[:10]
+
 
 class AuthHandlers:
-    """Handlers for authentication and registration."""
+    """Handlers for authentication and registration.
+
+    Updates are processed concurrently, so handlers must be re-entrant:
+    per-user state lives in ``context.user_data``.
+    """
 
     def __init__(self, tutors_db: TutorsDB, sheets_manager: SheetsManager):
         """Initialize auth handlers.
@@ -43,6 +95,9 @@ class AuthHandlers:
         """
         self.tutors_db = tutors_db
         self.sheets_manager = sheets_manager
+        self._sheet_checks: "OrderedDict[str, Tuple[float, Optional[str]]]" = (
+            OrderedDict()
+        )
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command.
@@ -52,48 +107,39 @@ class AuthHandlers:
         telegram_id = str(update.effective_user.id)
 
         try:
-            tutor = self.tutors_db.get_tutor(telegram_id)
+            tutor = await asyncio.to_thread(self.tutors_db.get_tutor, telegram_id)
             # Tutor is already registered
             message = Messages.START_WELCOME_REGISTERED.format(name=tutor.name)
-            reply_markup = ReplyKeyboardMarkup(
-                [["/profile"], ["/help"]],
-                resize_keyboard=True,
-                one_time_keyboard=False,
-            )
-            await update.message.reply_text(message, reply_markup=reply_markup)
+            await update.message.reply_text(message, reply_markup=KEYBOARD_REGISTERED)
         except TutorNotFoundError:
             # New tutor - offer registration
             message = Messages.START_WELCOME_NEW
-            reply_markup = ReplyKeyboardMarkup(
-                [["/register"], ["/help"]],
-                resize_keyboard=True,
-                one_time_keyboard=False,
-            )
-            await update.message.reply_text(message, reply_markup=reply_markup)
+            await update.message.reply_text(message, reply_markup=KEYBOARD_NEW)
 
     async def register_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start the registration conversation."""
         telegram_id = str(update.effective_user.id)
 
         try:
-            tutor = self.tutors_db.get_tutor(telegram_id)
+            tutor = await asyncio.to_thread(self.tutors_db.get_tutor, telegram_id)
             # User is already registered
             message = Messages.REGISTER_ALREADY_REGISTERED.format(name=tutor.name)
-            await update.message.reply_text(message, reply_markup=ReplyKeyboardRemove())
+            await update.message.reply_text(message, reply_markup=KEYBOARD_REMOVE)
             return ConversationHandler.END
         except TutorNotFoundError:
             # Proceed with registration
             message = Messages.REGISTER_ASK_NAME
-            await update.message.reply_text(message, reply_markup=ReplyKeyboardRemove())
+            await update.message.reply_text(message, reply_markup=KEYBOARD_REMOVE)
             return AWAITING_NAME
 
     async def register_name(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle name input during registration."""
-        name = update.message.text.strip() if update.message.text else ""
+        name = message_text(update)
 
         if not validate_name(name):
-            await update.message.reply_text(Messages.ERROR_INVALID_INPUT)
-            await update.message.reply_text(Messages.REGISTER_ASK_NAME)
+            await update.message.reply_text(
+                invalid_input_reply(Messages.REGISTER_ASK_NAME)
+            )
             return AWAITING_NAME
 
         name = sanitize_name(name)
@@ -105,7 +151,7 @@ class AuthHandlers:
 
     async def register_sheet(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle sheet URL/ID input during registration."""
-        sheet_input = update.message.text.strip() if update.message.text else ""
+        sheet_input = message_text(update)
 
         # Extract sheet ID from URL or validate as ID
         sheet_id = extract_sheet_id(sheet_input)
@@ -116,21 +162,12 @@ class AuthHandlers:
         # Validate sheet access and create required tabs
         await update.message.reply_text(Messages.REGISTER_PROCESSING)
 
-        try:
-            spreadsheet = self.sheets_manager.open_spreadsheet(sheet_id)
-            # Pre-create all required worksheets
-            self.sheets_manager.ensure_all_worksheets(spreadsheet)
-            logger.info(f"Successfully validated and initialized sheet: {sheet_id}")
-        except SheetNotFoundError:
-            message = Messages.REGISTER_SHEET_NOT_FOUND.format(sheet_id=sheet_id)
-            await update.message.reply_text(message)
-            await update.message.reply_text(Messages.REGISTER_ASK_SHEET)
-            return AWAITING_SHEET
-        except (WorksheetNotFoundError, Exception) as e:
-            logger.error(f"Error validating sheet {sheet_id}: {str(e)}")
-            message = Messages.REGISTER_SHEET_ACCESS_ERROR.format(sheet_id=sheet_id)
-            await update.message.reply_text(message)
-            await update.message.reply_text(Messages.REGISTER_ASK_SHEET)
+        error = await self._check_sheet(sheet_id)
+        if error is not None:
+            prompt = Messages.REGISTER_ASK_SHEET.format(
+                name=context.user_data.get("name", "")
+            )
+            await update.message.reply_text(f"{error}\n\n{prompt}")
             return AWAITING_SHEET
 
         # Register the tutor
@@ -138,23 +175,70 @@ class AuthHandlers:
         name = context.user_data.get("name", "Unknown")
 
         try:
-            self.tutors_db.register_tutor(
-                telegram_id=telegram_id, name=name, sheets_id=sheet_id
+            await asyncio.to_thread(
+                self.tutors_db.register_tutor,
+                telegram_id=telegram_id,
+                name=name,
+                sheets_id=sheet_id,
             )
             message = Messages.REGISTER_SUCCESS.format(name=name, sheet_id=sheet_id)
-            await update.message.reply_text(message, reply_markup=ReplyKeyboardRemove())
-            logger.info(f"Tutor registered: {telegram_id} - {name}")
+            await update.message.reply_text(message, reply_markup=KEYBOARD_REMOVE)
+            logger.info("Tutor registered: %s - %s", telegram_id, name)
             return ConversationHandler.END
         except TutorAlreadyExistsError:
             message = Messages.REGISTER_DUPLICATE.format(name=name)
-            await update.message.reply_text(message, reply_markup=ReplyKeyboardRemove())
-            logger.warning(f"Duplicate registration attempt for {telegram_id}")
+            await update.message.reply_text(message, reply_markup=KEYBOARD_REMOVE)
+            logger.warning("Duplicate registration attempt for %s", telegram_id)
             return ConversationHandler.END
 
+    async def _check_sheet(self, sheet_id: str) -> Optional[str]:
+        """Open a sheet and create its tabs, remembering the verdict.
+
+        Users often paste the same link several times in a row, so the
+        outcome is reused for SHEET_CHECK_TTL seconds after a success and
+        SHEET_CHECK_FAILURE_TTL seconds after a failure. Failures are kept
+        only briefly so that a user who has just shared the sheet with the
+        service account is checked again.
+
+        Args:
+            sheet_id: Google Sheets ID to validate.
+
+        Returns:
+            None if the sheet is usable, otherwise the error message to show.
+        """
+        now = time.monotonic()
+        cached = self._sheet_checks.get(sheet_id)
+        if cached is not None and cached[0] > now:
+            self._sheet_checks.move_to_end(sheet_id)
+            return cached[1]
+
+        error = None
+        try:
+            spreadsheet = await run_sheets(
+                self.sheets_manager.open_spreadsheet, sheet_id
+            )
+            # Pre-create all required worksheets
+            await run_sheets(
+                self.sheets_manager.ensure_all_worksheets, spreadsheet
+            )
+            logger.info("Successfully validated and initialized sheet: %s", sheet_id)
+        except SheetNotFoundError:
+            error = Messages.REGISTER_SHEET_NOT_FOUND.format(sheet_id=sheet_id)
+        except SHEETS_ERRORS as e:
+            logger.error("Error validating sheet %s: %s", sheet_id, e)
+            error = Messages.REGISTER_SHEET_ACCESS_ERROR.format(sheet_id=sheet_id)
+
+        ttl = SHEET_CHECK_TTL if error is None else SHEET_CHECK_FAILURE_TTL
+        self._sheet_checks[sheet_id] = (now + ttl, error)
+        self._sheet_checks.move_to_end(sheet_id)
+        while len(self._sheet_checks) > SHEET_CHECK_CACHE_SIZE:
+            self._sheet_checks.popitem(last=False)
+        return error
+
     async def register_cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle cancellation of registration conversation."""
         await update.message.reply_text(
-            Messages.REGISTER_CANCELLED, reply_markup=ReplyKeyboardRemove()
+            Messages.REGISTER_CANCELLED, reply_markup=KEYBOARD_REMOVE
         )
         return ConversationHandler.END
 
@@ -163,29 +247,15 @@ class AuthHandlers:
         telegram_id = str(update.effective_user.id)
 
         try:
-            tutor = self.tutors_db.get_tutor(telegram_id)
+            tutor = await asyncio.to_thread(self.tutors_db.get_tutor, telegram_id)
         except TutorNotFoundError:
             await update.message.reply_text(
-                Messages.PROFILE_NOT_REGISTERED, reply_markup=ReplyKeyboardRemove()
+                Messages.PROFILE_NOT_REGISTERED, reply_markup=KEYBOARD_REMOVE
             )
             return
 
-        # Format profile information
-        created_at = tutor.created_at
-        if isinstance(created_at, str):
-            try:
-                dt = datetime.fromisoformat(created_at)
-                created_at = dt.strftime("%d.%m.%Y %H:%M")
-            except (ValueError, AttributeError):
-                created_at = created_at[:10]  # Just the date part
-
-        updated_at = tutor.updated_at
-        if isinstance(updated_at, str):
-            try:
-                dt = datetime.fromisoformat(updated_at)
-                updated_at = dt.strftime("%d.%m.%Y %H:%M")
-            except (ValueError, AttributeError):
-                updated_at = updated_at[:10]  # Just the date part
+        created_at = _format_timestamp(tutor.created_at)
+        updated_at = _format_timestamp(tutor.updated_at)
 
         profile_text = (
             f"{Messages.PROFILE_HEADER}\n\n"
@@ -196,12 +266,12 @@ class AuthHandlers:
             f"{Messages.PROFILE_FOOTER}"
         )
 
-        await update.message.reply_text(profile_text, reply_markup=ReplyKeyboardRemove())
-        logger.info(f"Profile viewed by tutor: {telegram_id}")
+        await update.message.reply_text(profile_text, reply_markup=KEYBOARD_REMOVE)
+        logger.info("Profile viewed by tutor: %s", telegram_id)
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command."""
-        await update.message.reply_text(Messages.HELP_TEXT, reply_markup=ReplyKeyboardRemove())
+        await update.message.reply_text(Messages.HELP_TEXT, reply_markup=KEYBOARD_REMOVE)
 
     def get_conversation_handler(self) -> ConversationHandler:
         """Get the ConversationHandler for registration."""
@@ -211,12 +281,10 @@ class AuthHandlers:
             ],
             states={
                 AWAITING_NAME: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.register_name),
-                    CommandHandler("cancel", self.register_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.register_name),
                 ],
                 AWAITING_SHEET: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.register_sheet),
-                    CommandHandler("cancel", self.register_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.register_sheet),
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.register_cancel)],
@@ -224,28 +292,33 @@ class AuthHandlers:
         )
 
 
-def setup_auth_handlers(
-    application, tutors_db: TutorsDB, sheets_manager: SheetsManager
-):
+def setup_auth_handlers(application):
     """Set up authentication handlers in the application.
 
     Args:
-        application: The Telegram Application instance.
-        tutors_db: TutorsDB instance.
-        sheets_manager: SheetsManager instance.
+        application: The Telegram Application instance. Its bot_data must
+            hold the shared "tutors_db" and "sheets_manager" instances.
     """
-    auth_handlers = AuthHandlers(tutors_db, sheets_manager)
+    auth_handlers = AuthHandlers(
+        application.bot_data["tutors_db"], application.bot_data["sheets_manager"]
+    )
 
     # Add command handlers
     application.add_handler(
-        CommandHandler(config.BotCommands.START.value, auth_handlers.start_command)
+        CommandHandler(
+            config.BotCommands.START.value, auth_handlers.start_command, block=False
+        )
     )
     application.add_handler(auth_handlers.get_conversation_handler())
     application.add_handler(
-        CommandHandler(config.BotCommands.PROFILE.value, auth_handlers.profile_command)
+        CommandHandler(
+            config.BotCommands.PROFILE.value, auth_handlers.profile_command, block=False
+        )
     )
     application.add_handler(
-        CommandHandler(config.BotCommands.HELP.value, auth_handlers.help_command)
+        CommandHandler(
+            config.BotCommands.HELP.value, auth_handlers.help_command, block=False
+        )
     )
 
     logger.info("Auth handlers set up successfully")
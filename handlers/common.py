@@ -0,0 +1,70 @@
+"""Helpers shared by the Telegram bot handlers."""
+
+import asyncio
+import weakref
+from typing import Any, Callable, TypeVar
+
+from telegram import ReplyKeyboardRemove, Update
+from telegram.ext import filters
+
+from database.exceptions import SheetsBackendError
+from database.sheets_manager import MAX_CONNECTIONS
+from utils.messages import Messages
+
+# Failures of a Sheets call that are reported back to the user. SheetsManager
+# wraps gspread, HTTP and Google auth errors in SheetsBackendError; anything
+# else is a bug and is left to propagate to the application's error handling.
+SHEETS_ERRORS = (SheetsBackendError,)
+
+# Limits Sheets calls in flight to the manager's HTTP connection pool. An
+# asyncio.Semaphore binds to the loop that first waits on it, so one is made
+# per running loop instead of at import time; a restarted application or a
+# test with a fresh loop gets its own.
+_sheets_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+T = TypeVar("T")
+
+# Telegram objects are immutable, so one instance serves every reply
+KEYBOARD_REMOVE = ReplyKeyboardRemove()
+
+# Plain text replies inside conversations
+TEXT_NOT_COMMAND = filters.TEXT & ~filters.COMMAND
+
+
+async def run_sheets(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking SheetsManager call in a worker thread.
+
+    At most MAX_CONNECTIONS calls run at once; the rest wait here instead
+    of holding worker threads while they queue for an HTTP connection.
+
+    Args:
+        func: SheetsManager method to call.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        Whatever func returns.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _sheets_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _sheets_semaphores[loop] = asyncio.Semaphore(MAX_CONNECTIONS)
+    async with semaphore:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+def message_text(update: Update) -> str:
+    """Return the stripped text of the incoming message, or "" if it has none."""
+    return (update.message.text or "").strip()
+
+
+def invalid_input_reply(prompt: str) -> str:
+    """Combine the invalid-input notice and the re-prompt into one message.
+
+    Args:
+        prompt: Prompt asking the user for the value again.
+
+    Returns:
+        Text for a single reply.
+    """
+    return f"{Messages.ERROR_INVALID_INPUT}\n\n{prompt}"
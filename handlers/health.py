@@ -0,0 +1,35 @@
+"""Health check handler for the Telegram bot."""
+
+import logging
+
+from telegram import Update
+from telegram.ext import CommandHandler, ContextTypes
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Config paths are read from the environment once, so the reply is fixed
+_HEALTH_TEXT = (
+    "✅ Bot is running and healthy!\n"
+    f"Credentials path: {config.CREDENTIALS_PATH}\n"
+    f"Tutors config path: {config.TUTORS_CONFIG_PATH}"
+)
+
+
+async def health_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle the /health command - returns bot status."""
+    await update.message.reply_text(_HEALTH_TEXT)
+
+
+def setup_health_handlers(application):
+    """Set up the health check handler in the application.
+
+    Args:
+        application: The Telegram Application instance.
+    """
+    application.add_handler(
+        CommandHandler(config.BotCommands.HEALTH.value, health_command, block=False)
+    )
+
+    logger.info("Health handler set up successfully")
@@ -1,40 +1,88 @@
 """Student management handlers for the Telegram bot."""
 
+import asyncio
 import logging
-from typing import Optional
+import time
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakValueDictionary
 
-from telegram import Update, ReplyKeyboardRemove
+from telegram import Update
 from telegram.ext import (
     ContextTypes,
     ConversationHandler,
     CommandHandler,
     MessageHandler,
-    filters,
 )
 
 import config
 from database.tutors_db import TutorsDB
 from database.sheets_manager import SheetsManager
-from database.exceptions import (
-    TutorNotFoundError,
-    SheetNotFoundError,
-    WorksheetNotFoundError,
-    MalformedDataError,
+from database.exceptions import TutorNotFoundError
+from handlers.common import (
+    KEYBOARD_REMOVE,
+    SHEETS_ERRORS,
+    TEXT_NOT_COMMAND,
+    invalid_input_reply,
+    message_text,
+    run_sheets,
 )
 from utils.messages import Messages
+from utils.models import TutorConfig
 from utils.validators import sanitize_name
 
 logger = logging.getLogger(__name__)
 
+# Seconds a rendered /list_students reply is reused
+LIST_CACHE_TTL = 15.0
+
+# Telegram rejects messages over 4096 characters; keep some headroom
+MAX_MESSAGE_LENGTH = 4000
+
 # Conversation states for add_student
 ADD_AWAITING_PARENT, ADD_AWAITING_STUDENT, ADD_AWAITING_COST = range(3)
 
 # Conversation states for delete_student
 DEL_AWAITING_PARENT, DEL_AWAITING_STUDENT, DEL_AWAITING_CONFIRM = range(3, 6)
 
+# user_data keys owned by the student conversations
+CONVERSATION_KEYS = ("sheets_id", "parent_name", "student_name")
+
+
+def _split_message(
+    header: str, lines: List[str], limit: int = MAX_MESSAGE_LENGTH
+) -> List[str]:
+    """Join lines into messages no longer than limit, breaking between lines.
+
+    Args:
+        header: Text that starts the first message.
+        lines: Lines to append, each followed by a newline.
+        limit: Maximum length of one message.
+
+    Returns:
+        List of message texts.
+    """
+    chunks = []
+    parts = [header]
+    size = len(header)
+    for line in lines:
+        if size + len(line) + 1 > limit and size:
+            chunks.append("".join(parts))
+            parts = []
+            size = 0
+        parts.append(line)
+        parts.append("\n")
+        size += len(line) + 1
+    chunks.append("".join(parts))
+    return chunks
+
 
 class StudentHandlers:
-    """Handlers for student management commands."""
+    """Handlers for student management commands.
+
+    Updates are processed concurrently, so handlers must be re-entrant:
+    per-user state lives in ``context.user_data`` and sheet writes are
+    serialized per chat.
+    """
 
     def __init__(self, tutors_db: TutorsDB, sheets_manager: SheetsManager):
         """Initialize student handlers.
@@ -45,81 +93,162 @@ class StudentHandlers:
         """
         self.tutors_db = tutors_db
         self.sheets_manager = sheets_manager
+        self._chat_locks: "WeakValueDictionary[int, asyncio.Lock]" = (
+            WeakValueDictionary()
+        )
+        self._list_cache: Dict[str, Tuple[float, List[str]]] = {}
+        # Bumped by every student write so an in-flight render can tell
+        # that the rows it fetched may be out of date
+        self._list_generation = 0
 
-    async def _check_registration(
-        self, update: Update, context: ContextTypes.DEFAULT_TYPE
-    ) -> Optional[str]:
-        """Check if user is registered and return sheets_id.
+    def _chat_lock(self, update: Update) -> asyncio.Lock:
+        """Get the lock that serializes sheet writes for the update's chat.
+
+        Writes from one chat are applied in the order their messages arrive,
+        while other chats proceed in parallel. Locks are held weakly and go
+        away once no handler is using them.
+        """
+        chat_id = update.effective_chat.id
+        lock = self._chat_locks.get(chat_id)
+        if lock is None:
+            lock = self._chat_locks[chat_id] = asyncio.Lock()
+        return lock
+
+    async def _get_tutor(self, update: Update) -> Optional[TutorConfig]:
+        """Look up the tutor sending the update.
+
+        Replies with the not-registered message if there is none.
 
         Returns:
-            sheets_id if registered, None otherwise.
+            TutorConfig if registered, None otherwise.
         """
         telegram_id = str(update.effective_user.id)
         try:
-            tutor = self.tutors_db.get_tutor(telegram_id)
-            return tutor.sheets_id
+            return await asyncio.to_thread(self.tutors_db.get_tutor, telegram_id)
         except TutorNotFoundError:
             await update.message.reply_text(
-                Messages.PROFILE_NOT_REGISTERED, reply_markup=ReplyKeyboardRemove()
+                Messages.PROFILE_NOT_REGISTERED, reply_markup=KEYBOARD_REMOVE
             )
             return None
 
+    async def _check_registration(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> Optional[str]:
+        """Check if user is registered and return sheets_id.
+
+        Returns:
+            sheets_id if registered, None otherwise.
+        """
+        tutor = await self._get_tutor(update)
+        return tutor.sheets_id if tutor else None
+
+    async def _start_conversation(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> Optional[str]:
+        """Look up the tutor once for a new conversation.
+
+        The tutor's sheets_id is stored in ``context.user_data`` so later
+        states read it from there instead of querying the database again.
+
+        Returns:
+            sheets_id if registered, None otherwise.
+        """
+        tutor = await self._get_tutor(update)
+        if tutor is None:
+            return None
+        context.user_data["sheets_id"] = tutor.sheets_id
+        return tutor.sheets_id
+
+    async def _conversation_sheets_id(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ) -> Optional[str]:
+        """Get the sheets_id stored at conversation start.
+
+        Falls back to a fresh lookup if ``context.user_data`` was lost,
+        e.g. for a conversation left over from before a restart.
+
+        Returns:
+            sheets_id if registered, None otherwise.
+        """
+        sheets_id = context.user_data.get("sheets_id")
+        if sheets_id:
+            return sheets_id
+        return await self._start_conversation(update, context)
+
+    @staticmethod
+    def _end_conversation(context: ContextTypes.DEFAULT_TYPE) -> int:
+        """Drop the conversation's user_data so it cannot leak into the next one.
+
+        Returns:
+            ConversationHandler.END.
+        """
+        for key in CONVERSATION_KEYS:
+            context.user_data.pop(key, None)
+        return ConversationHandler.END
+
     async def add_student_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start the add student conversation."""
-        sheets_id = await self._check_registration(update, context)
+        sheets_id = await self._start_conversation(update, context)
         if not sheets_id:
-            return ConversationHandler.END
+            return self._end_conversation(context)
 
         # Check if args are provided
-        if context.args and len(context.args) >= 3:
-            # All arguments provided: /add_student Parent Student Cost
-            parent_name = sanitize_name(" ".join(context.args[:-2]))
-            student_name = sanitize_name(context.args[-2])
-            lesson_cost = context.args[-1]
+        args = context.args
+        if args and len(args) >= 3:
+            # All arguments provided: /add_student Parent Student Cost.
+            # PTB splits args on whitespace, so they are already sanitized.
+            *parent_parts, student_name, lesson_cost = args
+            parent_name = " ".join(parent_parts)
 
             try:
-                self.sheets_manager.add_student_record(
-                    sheets_id, parent_name, student_name, lesson_cost
-                )
+                async with self._chat_lock(update):
+                    await run_sheets(
+                        self.sheets_manager.add_student_record,
+                        sheets_id,
+                        parent_name,
+                        student_name,
+                        lesson_cost,
+                    )
+                    self._invalidate_list(sheets_id)
                 message = Messages.ADD_STUDENT_SUCCESS.format(
                     parent_name=parent_name,
                     student_name=student_name,
                     lesson_cost=lesson_cost,
                 )
                 await update.message.reply_text(
-                    message, reply_markup=ReplyKeyboardRemove()
+                    message, reply_markup=KEYBOARD_REMOVE
                 )
-                logger.info(f"Student added: {parent_name} - {student_name}")
-                return ConversationHandler.END
-            except ValueError as e:
+                logger.info("Student added: %s - %s", parent_name, student_name)
+                return self._end_conversation(context)
+            except ValueError:
                 await update.message.reply_text(
                     Messages.ADD_STUDENT_DUPLICATE.format(
                         parent_name=parent_name, student_name=student_name
                     )
                 )
-                logger.warning(f"Duplicate student: {parent_name} - {student_name}")
-                return ConversationHandler.END
-            except (SheetNotFoundError, WorksheetNotFoundError, Exception) as e:
-                logger.error(f"Error adding student: {str(e)}")
+                logger.warning("Duplicate student: %s - %s", parent_name, student_name)
+                return self._end_conversation(context)
+            except SHEETS_ERRORS as e:
+                logger.error("Error adding student: %s", e)
                 await update.message.reply_text(
-                    Messages.format_error(str(e)), reply_markup=ReplyKeyboardRemove()
+                    Messages.format_error(str(e)), reply_markup=KEYBOARD_REMOVE
                 )
-                return ConversationHandler.END
+                return self._end_conversation(context)
 
         # Interactive mode - no args provided
-        context.user_data["sheets_id"] = sheets_id
         await update.message.reply_text(
-            Messages.ADD_STUDENT_PROMPT_PARENT, reply_markup=ReplyKeyboardRemove()
+            Messages.ADD_STUDENT_PROMPT_PARENT, reply_markup=KEYBOARD_REMOVE
         )
         return ADD_AWAITING_PARENT
 
     async def add_student_parent(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle parent name input."""
-        parent_name = sanitize_name(update.message.text.strip()) if update.message.text else ""
+        parent_name = sanitize_name(message_text(update))
 
         if not parent_name:
-            await update.message.reply_text(Messages.ERROR_INVALID_INPUT)
-            await update.message.reply_text(Messages.ADD_STUDENT_PROMPT_PARENT)
+            await update.message.reply_text(
+                invalid_input_reply(Messages.ADD_STUDENT_PROMPT_PARENT)
+            )
             return ADD_AWAITING_PARENT
 
         context.user_data["parent_name"] = parent_name
@@ -128,11 +257,12 @@ class StudentHandlers:
 
     async def add_student_student(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle student name input."""
-        student_name = sanitize_name(update.message.text.strip()) if update.message.text else ""
+        student_name = sanitize_name(message_text(update))
 
         if not student_name:
-            await update.message.reply_text(Messages.ERROR_INVALID_INPUT)
-            await update.message.reply_text(Messages.ADD_STUDENT_PROMPT_STUDENT)
+            await update.message.reply_text(
+                invalid_input_reply(Messages.ADD_STUDENT_PROMPT_STUDENT)
+            )
             return ADD_AWAITING_STUDENT
 
         context.user_data["student_name"] = student_name
@@ -141,53 +271,62 @@ class StudentHandlers:
 
     async def add_student_cost(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle lesson cost input and save the student."""
-        lesson_cost = update.message.text.strip() if update.message.text else ""
+        lesson_cost = message_text(update)
 
         if not lesson_cost:
-            await update.message.reply_text(Messages.ERROR_INVALID_INPUT)
-            await update.message.reply_text(Messages.ADD_STUDENT_PROMPT_COST)
+            await update.message.reply_text(
+                invalid_input_reply(Messages.ADD_STUDENT_PROMPT_COST)
+            )
             return ADD_AWAITING_COST
 
-        sheets_id = context.user_data.get("sheets_id")
+        sheets_id = await self._conversation_sheets_id(update, context)
+        if not sheets_id:
+            return self._end_conversation(context)
         parent_name = context.user_data.get("parent_name", "")
         student_name = context.user_data.get("student_name", "")
 
         try:
-            self.sheets_manager.add_student_record(
-                sheets_id, parent_name, student_name, lesson_cost
-            )
+            async with self._chat_lock(update):
+                await run_sheets(
+                    self.sheets_manager.add_student_record,
+                    sheets_id,
+                    parent_name,
+                    student_name,
+                    lesson_cost,
+                )
+                self._invalidate_list(sheets_id)
             message = Messages.ADD_STUDENT_SUCCESS.format(
                 parent_name=parent_name,
                 student_name=student_name,
                 lesson_cost=lesson_cost,
             )
             await update.message.reply_text(
-                message, reply_markup=ReplyKeyboardRemove()
+                message, reply_markup=KEYBOARD_REMOVE
             )
-            logger.info(f"Student added: {parent_name} - {student_name}")
-            return ConversationHandler.END
+            logger.info("Student added: %s - %s", parent_name, student_name)
+            return self._end_conversation(context)
         except ValueError:
             await update.message.reply_text(
                 Messages.ADD_STUDENT_DUPLICATE.format(
                     parent_name=parent_name, student_name=student_name
                 ),
-                reply_markup=ReplyKeyboardRemove(),
+                reply_markup=KEYBOARD_REMOVE,
             )
-            logger.warning(f"Duplicate student: {parent_name} - {student_name}")
-            return ConversationHandler.END
-        except (SheetNotFoundError, WorksheetNotFoundError, Exception) as e:
-            logger.error(f"Error adding student: {str(e)}")
+            logger.warning("Duplicate student: %s - %s", parent_name, student_name)
+            return self._end_conversation(context)
+        except SHEETS_ERRORS as e:
+            logger.error("Error adding student: %s", e)
             await update.message.reply_text(
-                Messages.format_error(str(e)), reply_markup=ReplyKeyboardRemove()
+                Messages.format_error(str(e)), reply_markup=KEYBOARD_REMOVE
             )
-            return ConversationHandler.END
+            return self._end_conversation(context)
 
     async def add_student_cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle cancellation of add student conversation."""
         await update.message.reply_text(
-            Messages.ADD_STUDENT_CANCELLED, reply_markup=ReplyKeyboardRemove()
+            Messages.ADD_STUDENT_CANCELLED, reply_markup=KEYBOARD_REMOVE
         )
-        return ConversationHandler.END
+        return self._end_conversation(context)
 
     async def list_students_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /list_students command."""
@@ -196,76 +335,120 @@ class StudentHandlers:
             return
 
         try:
-            records = self.sheets_manager.get_student_records(sheets_id)
+            chunks = await self._render_student_list(sheets_id)
+        except SHEETS_ERRORS as e:
+            logger.error("Error listing students: %s", e)
+            await update.message.reply_text(
+                Messages.format_error(str(e)), reply_markup=KEYBOARD_REMOVE
+            )
+            return
 
-            if not records:
-                await update.message.reply_text(
-                    Messages.LIST_STUDENTS_EMPTY, reply_markup=ReplyKeyboardRemove()
-                )
-                return
+        for chunk in chunks:
+            await update.message.reply_text(chunk, reply_markup=KEYBOARD_REMOVE)
+
+    def _invalidate_list(self, sheets_id: str) -> None:
+        """Forget the rendered student list of a sheet after a write."""
+        self._list_cache.pop(sheets_id, None)
+        self._list_generation += 1
+
+    async def _render_student_list(self, sheets_id: str) -> List[str]:
+        """Render the student list for a sheet, reusing a recent rendering.
+
+        A rendering is not cached if any student was added or deleted while
+        the rows were being fetched, since it may predate that write.
+        Expired renderings are dropped whenever a new one is stored.
 
-            message = Messages.LIST_STUDENTS_HEADER
-            for idx, record in enumerate(records, start=1):
-                message += Messages.LIST_STUDENTS_ITEM.format(
+        Args:
+            sheets_id: Google Sheets ID of the tutor.
+
+        Returns:
+            Message texts to send, each within Telegram's size limit.
+        """
+        now = time.monotonic()
+        cached = self._list_cache.get(sheets_id)
+        if cached is not None and now - cached[0] < LIST_CACHE_TTL:
+            return cached[1]
+
+        generation = self._list_generation
+        records = await run_sheets(
+            self.sheets_manager.get_student_records, sheets_id
+        )
+        if records:
+            item = Messages.LIST_STUDENTS_ITEM
+            lines = [
+                item.format(
                     idx=idx,
                     parent_name=record.parent_name,
                     student_name=record.student_name,
                     lesson_cost=record.lesson_cost,
                 )
-                message += "\n"
-
-            await update.message.reply_text(message, reply_markup=ReplyKeyboardRemove())
-            logger.info(f"Listed {len(records)} students")
-        except (SheetNotFoundError, WorksheetNotFoundError, MalformedDataError) as e:
-            logger.error(f"Error listing students: {str(e)}")
-            await update.message.reply_text(
-                Messages.format_error(str(e)), reply_markup=ReplyKeyboardRemove()
-            )
+                for idx, record in enumerate(records, start=1)
+            ]
+            chunks = _split_message(Messages.LIST_STUDENTS_HEADER, lines)
+        else:
+            chunks = [Messages.LIST_STUDENTS_EMPTY]
+
+        if generation == self._list_generation:
+            for key in [
+                key
+                for key, (stored, _) in self._list_cache.items()
+                if now - stored >= LIST_CACHE_TTL
+            ]:
+                del self._list_cache[key]
+            self._list_cache[sheets_id] = (now, chunks)
+        logger.info("Listed %d students", len(records))
+        return chunks
 
     async def delete_student_start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Start the delete student conversation."""
-        sheets_id = await self._check_registration(update, context)
+        sheets_id = await self._start_conversation(update, context)
         if not sheets_id:
-            return ConversationHandler.END
+            return self._end_conversation(context)
 
         # Check if args are provided
-        if context.args and len(context.args) >= 2:
-            # All arguments provided: /delete_student Parent Student
-            parent_name = sanitize_name(" ".join(context.args[:-1]))
-            student_name = sanitize_name(context.args[-1])
+        args = context.args
+        if args and len(args) >= 2:
+            # All arguments provided: /delete_student Parent Student.
+            # PTB splits args on whitespace, so they are already sanitized.
+            *parent_parts, student_name = args
+            parent_name = " ".join(parent_parts)
 
             try:
-                deleted = self.sheets_manager.delete_student_record(
-                    sheets_id, parent_name, student_name
-                )
+                async with self._chat_lock(update):
+                    deleted = await run_sheets(
+                        self.sheets_manager.delete_student_record,
+                        sheets_id,
+                        parent_name,
+                        student_name,
+                    )
+                    self._invalidate_list(sheets_id)
                 if deleted:
                     message = Messages.DELETE_STUDENT_SUCCESS.format(
                         parent_name=parent_name, student_name=student_name
                     )
                     await update.message.reply_text(
-                        message, reply_markup=ReplyKeyboardRemove()
+                        message, reply_markup=KEYBOARD_REMOVE
                     )
-                    logger.info(f"Student deleted: {parent_name} - {student_name}")
+                    logger.info("Student deleted: %s - %s", parent_name, student_name)
                 else:
                     await update.message.reply_text(
                         Messages.DELETE_STUDENT_NOT_FOUND.format(
                             parent_name=parent_name, student_name=student_name
                         ),
-                        reply_markup=ReplyKeyboardRemove(),
+                        reply_markup=KEYBOARD_REMOVE,
                     )
-                    logger.warning(f"Student not found: {parent_name} - {student_name}")
-                return ConversationHandler.END
-            except (SheetNotFoundError, WorksheetNotFoundError, Exception) as e:
-                logger.error(f"Error deleting student: {str(e)}")
+                    logger.warning("Student not found: %s - %s", parent_name, student_name)
+                return self._end_conversation(context)
+            except SHEETS_ERRORS as e:
+                logger.error("Error deleting student: %s", e)
                 await update.message.reply_text(
-                    Messages.format_error(str(e)), reply_markup=ReplyKeyboardRemove()
+                    Messages.format_error(str(e)), reply_markup=KEYBOARD_REMOVE
                 )
-                return ConversationHandler.END
+                return self._end_conversation(context)
 
         # Interactive mode - no args provided
-        context.user_data["sheets_id"] = sheets_id
         await update.message.reply_text(
-            Messages.DELETE_STUDENT_PROMPT_PARENT, reply_markup=ReplyKeyboardRemove()
+            Messages.DELETE_STUDENT_PROMPT_PARENT, reply_markup=KEYBOARD_REMOVE
         )
         return DEL_AWAITING_PARENT
 
@@ -273,11 +456,12 @@ class StudentHandlers:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle parent name input for deletion."""
-        parent_name = sanitize_name(update.message.text.strip()) if update.message.text else ""
+        parent_name = sanitize_name(message_text(update))
 
         if not parent_name:
-            await update.message.reply_text(Messages.ERROR_INVALID_INPUT)
-            await update.message.reply_text(Messages.DELETE_STUDENT_PROMPT_PARENT)
+            await update.message.reply_text(
+                invalid_input_reply(Messages.DELETE_STUDENT_PROMPT_PARENT)
+            )
             return DEL_AWAITING_PARENT
 
         context.user_data["parent_name"] = parent_name
@@ -288,11 +472,12 @@ class StudentHandlers:
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
         """Handle student name input for deletion."""
-        student_name = sanitize_name(update.message.text.strip()) if update.message.text else ""
+        student_name = sanitize_name(message_text(update))
 
         if not student_name:
-            await update.message.reply_text(Messages.ERROR_INVALID_INPUT)
-            await update.message.reply_text(Messages.DELETE_STUDENT_PROMPT_STUDENT)
+            await update.message.reply_text(
+                invalid_input_reply(Messages.DELETE_STUDENT_PROMPT_STUDENT)
+            )
             return DEL_AWAITING_STUDENT
 
         parent_name = context.user_data.get("parent_name", "")
@@ -307,62 +492,63 @@ class StudentHandlers:
     async def delete_student_confirm(
         self, update: Update, context: ContextTypes.DEFAULT_TYPE
     ):
-        """Handle deletion confirmation."""
-        user_input = update.message.text.strip().lower()
-
-        if user_input.startswith("/confirm"):
-            sheets_id = context.user_data.get("sheets_id")
-            parent_name = context.user_data.get("parent_name", "")
-            student_name = context.user_data.get("student_name", "")
+        """Handle /confirm and delete the student."""
+        sheets_id = await self._conversation_sheets_id(update, context)
+        if not sheets_id:
+            return self._end_conversation(context)
+        parent_name = context.user_data.get("parent_name", "")
+        student_name = context.user_data.get("student_name", "")
 
-            try:
-                deleted = self.sheets_manager.delete_student_record(
-                    sheets_id, parent_name, student_name
+        try:
+            async with self._chat_lock(update):
+                deleted = await run_sheets(
+                    self.sheets_manager.delete_student_record,
+                    sheets_id,
+                    parent_name,
+                    student_name,
+                )
+                self._invalidate_list(sheets_id)
+            if deleted:
+                message = Messages.DELETE_STUDENT_SUCCESS.format(
+                    parent_name=parent_name, student_name=student_name
                 )
-                if deleted:
-                    message = Messages.DELETE_STUDENT_SUCCESS.format(
-                        parent_name=parent_name, student_name=student_name
-                    )
-                    await update.message.reply_text(
-                        message, reply_markup=ReplyKeyboardRemove()
-                    )
-                    logger.info(f"Student deleted: {parent_name} - {student_name}")
-                    return ConversationHandler.END
-                else:
-                    await update.message.reply_text(
-                        Messages.DELETE_STUDENT_NOT_FOUND.format(
-                            parent_name=parent_name, student_name=student_name
-                        ),
-                        reply_markup=ReplyKeyboardRemove(),
-                    )
-                    logger.warning(f"Student not found: {parent_name} - {student_name}")
-                    return ConversationHandler.END
-            except (SheetNotFoundError, WorksheetNotFoundError, Exception) as e:
-                logger.error(f"Error deleting student: {str(e)}")
                 await update.message.reply_text(
-                    Messages.format_error(str(e)), reply_markup=ReplyKeyboardRemove()
+                    message, reply_markup=KEYBOARD_REMOVE
                 )
-                return ConversationHandler.END
-        elif user_input.startswith("/cancel"):
+                logger.info("Student deleted: %s - %s", parent_name, student_name)
+            else:
+                await update.message.reply_text(
+                    Messages.DELETE_STUDENT_NOT_FOUND.format(
+                        parent_name=parent_name, student_name=student_name
+                    ),
+                    reply_markup=KEYBOARD_REMOVE,
+                )
+                logger.warning("Student not found: %s - %s", parent_name, student_name)
+        except SHEETS_ERRORS as e:
+            logger.error("Error deleting student: %s", e)
             await update.message.reply_text(
-                Messages.DELETE_STUDENT_CANCELLED, reply_markup=ReplyKeyboardRemove()
+                Messages.format_error(str(e)), reply_markup=KEYBOARD_REMOVE
             )
-            return ConversationHandler.END
-        else:
-            await update.message.reply_text(
-                Messages.DELETE_STUDENT_CONFIRMATION.format(
-                    parent_name=context.user_data.get("parent_name", ""),
-                    student_name=context.user_data.get("student_name", ""),
-                )
+        return self._end_conversation(context)
+
+    async def delete_student_reprompt(
+        self, update: Update, context: ContextTypes.DEFAULT_TYPE
+    ):
+        """Repeat the confirmation prompt for any other text."""
+        await update.message.reply_text(
+            Messages.DELETE_STUDENT_CONFIRMATION.format(
+                parent_name=context.user_data.get("parent_name", ""),
+                student_name=context.user_data.get("student_name", ""),
             )
-            return DEL_AWAITING_CONFIRM
+        )
+        return DEL_AWAITING_CONFIRM
 
     async def delete_student_cancel(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle cancellation of delete student conversation."""
         await update.message.reply_text(
-            Messages.DELETE_STUDENT_CANCELLED, reply_markup=ReplyKeyboardRemove()
+            Messages.DELETE_STUDENT_CANCELLED, reply_markup=KEYBOARD_REMOVE
         )
-        return ConversationHandler.END
+        return self._end_conversation(context)
 
     def get_add_student_handler(self) -> ConversationHandler:
         """Get the ConversationHandler for adding students."""
@@ -372,16 +558,13 @@ class StudentHandlers:
             ],
             states={
                 ADD_AWAITING_PARENT: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.add_student_parent),
-                    CommandHandler("cancel", self.add_student_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.add_student_parent),
                 ],
                 ADD_AWAITING_STUDENT: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.add_student_student),
-                    CommandHandler("cancel", self.add_student_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.add_student_student),
                 ],
                 ADD_AWAITING_COST: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.add_student_cost),
-                    CommandHandler("cancel", self.add_student_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.add_student_cost),
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.add_student_cancel)],
@@ -396,17 +579,14 @@ class StudentHandlers:
             ],
             states={
                 DEL_AWAITING_PARENT: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.delete_student_parent),
-                    CommandHandler("cancel", self.delete_student_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.delete_student_parent),
                 ],
                 DEL_AWAITING_STUDENT: [
-                    MessageHandler(filters.TEXT & ~filters.COMMAND, self.delete_student_student),
-                    CommandHandler("cancel", self.delete_student_cancel),
+                    MessageHandler(TEXT_NOT_COMMAND, self.delete_student_student),
                 ],
                 DEL_AWAITING_CONFIRM: [
                     CommandHandler("confirm", self.delete_student_confirm),
-                    CommandHandler("cancel", self.delete_student_cancel),
-                    MessageHandler(filters.TEXT, self.delete_student_confirm),
+                    MessageHandler(TEXT_NOT_COMMAND, self.delete_student_reprompt),
                 ],
             },
             fallbacks=[CommandHandler("cancel", self.delete_student_cancel)],
@@ -414,15 +594,16 @@ class StudentHandlers:
         )
 
 
-def setup_student_handlers(application, tutors_db: TutorsDB, sheets_manager: SheetsManager):
+def setup_student_handlers(application):
     """Set up student handlers in the application.
 
     Args:
-        application: The Telegram Application instance.
-        tutors_db: TutorsDB instance.
-        sheets_manager: SheetsManager instance.
+        application: The Telegram Application instance. Its bot_data must
+            hold the shared "tutors_db" and "sheets_manager" instances.
     """
-    student_handlers = StudentHandlers(tutors_db, sheets_manager)
+    student_handlers = StudentHandlers(
+        application.bot_data["tutors_db"], application.bot_data["sheets_manager"]
+    )
 
     # Add conversation handlers
     application.add_handler(student_handlers.get_add_student_handler())
@@ -430,7 +611,11 @@ def setup_student_handlers(application, tutors_db: TutorsDB, sheets_manager: She
 
     # Add list command handler
     application.add_handler(
-        CommandHandler(config.BotCommands.LIST_STUDENTS.value, student_handlers.list_students_command)
+        CommandHandler(
+            config.BotCommands.LIST_STUDENTS.value,
+            student_handlers.list_students_command,
+            block=False,
+        )
     )
 
     logger.info("Student handlers set up successfully")
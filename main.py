@@ -1,57 +1,81 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from telegram import Update
-from telegram.ext import ApplicationBuilder, CommandHandler, ContextTypes
+from telegram.ext import ApplicationBuilder
 
 import config
 from database.tutors_db import TutorsDB
-from database.sheets_manager import SheetsManager
+from database.sheets_manager import get_sheets_manager
 from handlers.auth import setup_auth_handlers
+from handlers.health import setup_health_handlers
 from handlers.students import setup_student_handlers
 
-
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=getattr(logging, config.LOG_LEVEL)
-)
-
 logger = logging.getLogger(__name__)
 
 
-async def health_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle the /health command - returns bot status."""
-    await update.message.reply_text(
-        "✅ Bot is running and healthy!\n"
-        f"Credentials path: {config.CREDENTIALS_PATH}\n"
-        f"Tutors config path: {config.TUTORS_CONFIG_PATH}"
+async def post_init(application):
+    """Size the I/O thread pool and fetch the Sheets token before serving."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=config.IO_WORKERS, thread_name_prefix="io")
     )
+    await asyncio.to_thread(application.bot_data["sheets_manager"].warm_up)
 
 
 def main():
     """Start the bot."""
+    logging.basicConfig(
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        level=getattr(logging, config.LOG_LEVEL)
+    )
     logger.info("Starting Telegram bot...")
     
     try:
         config.validate_config()
     except (ValueError, FileNotFoundError) as e:
-        logger.warning(f"Configuration validation failed: {e}")
+        logger.warning("Configuration validation failed: %s", e)
         logger.info("Continuing without validation for development purposes...")
     
-    application = ApplicationBuilder().token(config.TELEGRAM_BOT_TOKEN).build()
+    application = (
+        ApplicationBuilder()
+        .token(config.TELEGRAM_BOT_TOKEN)
+        .concurrent_updates(config.CONCURRENT_UPDATES)
+        .post_init(post_init)
+        .build()
+    )
     
-    # Initialize database managers
-    tutors_db = TutorsDB(config.TUTORS_CONFIG_PATH)
-    sheets_manager = SheetsManager(config.CREDENTIALS_PATH)
+    # Initialize database managers, shared by all handlers through bot_data
+    application.bot_data["tutors_db"] = TutorsDB(config.TUTORS_CONFIG_PATH)
+    application.bot_data["sheets_manager"] = get_sheets_manager(
+        config.CREDENTIALS_PATH
+    )
     
-    application.add_handler(CommandHandler(config.BotCommands.HEALTH.value, health_command))
+    # Set up health check handler
+    setup_health_handlers(application)
     
     # Set up auth handlers (start, register, profile, help)
-    setup_auth_handlers(application, tutors_db, sheets_manager)
+    setup_auth_handlers(application)
     
     # Set up student handlers (add, list, delete)
-    setup_student_handlers(application, tutors_db, sheets_manager)
+    setup_student_handlers(application)
     
-    logger.info("Bot initialized successfully. Starting polling...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    if config.WEBHOOK_URL:
+        # Telegram pushes updates as they happen instead of waiting for the
+        # next getUpdates round-trip.
+        url_path = config.TELEGRAM_BOT_TOKEN
+        logger.info("Bot initialized successfully. Starting webhook...")
+        application.run_webhook(
+            listen=config.WEBHOOK_LISTEN,
+            port=config.WEBHOOK_PORT,
+            url_path=url_path,
+            webhook_url=f"{config.WEBHOOK_URL.rstrip('/')}/{url_path}",
+            secret_token=config.WEBHOOK_SECRET,
+            allowed_updates=Update.ALL_TYPES,
+        )
+    else:
+        logger.info("Bot initialized successfully. Starting polling...")
+        application.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,36 @@
+"""Fixtures shared by the test modules."""
+
+import json
+
+import pytest
+
+from database.sheets_manager import _credentials
+
+
+@pytest.fixture(scope="session")
+def temp_credentials(tmp_path_factory):
+    """Create one service account key file for the whole test session.
+
+    Tests patch the credentials loader, so only the file's existence and
+    basic shape matter.
+    """
+    path = tmp_path_factory.mktemp("credentials") / "credentials.json"
+    path.write_text(
+        json.dumps(
+            {
+                "type": "service_account",
+                "project_id": "test-project",
+                "client_email": "test@test-project.iam.gserviceaccount.com",
+                "token_uri": "https://oauth2.googleapis.com/token",
+            }
+        )
+    )
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fresh_credentials():
+    """Forget credentials loaded by earlier tests from the shared key file."""
+    _credentials.cache_clear()
+    yield
+    _credentials.cache_clear()
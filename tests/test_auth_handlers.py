@@ -1,7 +1,7 @@
 """Tests for authentication handlers."""
 
 import pytest
-import tempfile
+import shutil
 import json
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
@@ -9,7 +9,12 @@ from datetime import datetime
 from telegram import Update, Message, User, Chat
 from telegram.ext import ContextTypes
 
-from handlers.auth import AuthHandlers, AWAITING_NAME, AWAITING_SHEET
+from handlers.auth import (
+    AuthHandlers,
+    AWAITING_NAME,
+    AWAITING_SHEET,
+    _format_timestamp,
+)
 from database.tutors_db import TutorsDB
 from database.sheets_manager import SheetsManager
 from database.exceptions import (
@@ -118,15 +123,39 @@ class TestSanitizeName:
         assert sanitize_name("John Doe") == "John Doe"
 
 
+class TestFormatTimestamp:
+    """Tests for profile timestamp formatting."""
+
+    def test_iso_timestamp(self):
+        """Test stored ISO timestamps are shown as DD.MM.YYYY HH:MM."""
+        assert _format_timestamp("2024-03-05T14:07:09.123456") == "05.03.2024 14:07"
+
+    def test_date_only(self):
+        """Test date-only values fall back to full ISO parsing."""
+        assert _format_timestamp("2024-03-05") == "05.03.2024 00:00"
+
+    def test_unparsable(self):
+        """Test unparsable strings are cut to the first ten characters."""
+        assert _format_timestamp("not a timestamp") == "not a time"
+
+
+@pytest.fixture(scope="module")
+def db_template(tmp_path_factory):
+    """Write an empty database once for the whole module."""
+    path = tmp_path_factory.mktemp("db") / "tutors_config.json"
+    path.write_text(json.dumps({"tutors": []}))
+    return path
+
+
 class TestAuthHandlers:
     """Tests for authentication handlers."""
 
     @pytest.fixture
-    def temp_db_path(self):
-        """Create a temporary database file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({"tutors": []}, f)
-            return f.name
+    def temp_db_path(self, db_template, tmp_path):
+        """Create a fresh copy of the empty database."""
+        path = tmp_path / "tutors_config.json"
+        shutil.copy(db_template, path)
+        return str(path)
 
     @pytest.fixture
     def tutors_db(self, temp_db_path):
@@ -228,7 +257,7 @@ class TestAuthHandlers:
         result = await auth_handlers.register_name(mock_update, mock_context)
         
         assert result == AWAITING_NAME
-        mock_update.message.reply_text.assert_called()
+        mock_update.message.reply_text.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_register_sheet_valid(self, auth_handlers, sheets_manager, mock_update, mock_context):
@@ -259,6 +288,19 @@ class TestAuthHandlers:
         assert result == AWAITING_SHEET
         mock_update.message.reply_text.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_register_sheet_check_cached(self, auth_handlers, sheets_manager, mock_update, mock_context):
+        """Test pasting the same failing sheet again reuses the verdict."""
+        mock_update.message.text = "1ABC2DEF3GHI4JKL"
+        mock_update.message.reply_text = AsyncMock()
+        mock_context.user_data["name"] = "John Doe"
+
+        sheets_manager.open_spreadsheet.side_effect = SheetNotFoundError("Sheet not found")
+
+        assert await auth_handlers.register_sheet(mock_update, mock_context) == AWAITING_SHEET
+        assert await auth_handlers.register_sheet(mock_update, mock_context) == AWAITING_SHEET
+        sheets_manager.open_spreadsheet.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_register_sheet_not_found(self, auth_handlers, sheets_manager, mock_update, mock_context):
         """Test sheet not found error."""
@@ -272,6 +314,11 @@ class TestAuthHandlers:
         
         assert result == AWAITING_SHEET
         assert sheets_manager.open_spreadsheet.called
+        # Processing notice, then the error and the re-prompt in one message
+        assert mock_update.message.reply_text.call_count == 2
+        message = mock_update.message.reply_text.call_args[0][0]
+        assert "1ABC2DEF3GHI4JKL" in message
+        assert "John Doe" in message
 
     @pytest.mark.asyncio
     async def test_profile_registered_user(self, auth_handlers, tutors_db, mock_update, mock_context):
@@ -0,0 +1,18 @@
+"""Tests for helpers shared by the handlers."""
+
+import asyncio
+import time
+
+from database.sheets_manager import MAX_CONNECTIONS
+from handlers.common import run_sheets
+
+
+def test_run_sheets_across_event_loops():
+    """Test the Sheets semaphore keeps working when a new event loop starts."""
+
+    async def contended():
+        calls = [run_sheets(time.sleep, 0.01) for _ in range(MAX_CONNECTIONS + 1)]
+        return await asyncio.gather(*calls)
+
+    assert asyncio.run(contended()) == [None] * (MAX_CONNECTIONS + 1)
+    assert asyncio.run(contended()) == [None] * (MAX_CONNECTIONS + 1)
@@ -0,0 +1,26 @@
+"""Tests for the health check handler."""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from telegram import Update, Message
+from telegram.ext import ContextTypes
+
+import config
+from handlers.health import health_command
+
+
+@pytest.mark.asyncio
+async def test_health_command():
+    """Test /health reports the configured paths."""
+    update = Mock(spec=Update)
+    update.message = Mock(spec=Message)
+    update.message.reply_text = AsyncMock()
+    context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+
+    await health_command(update, context)
+
+    message = update.message.reply_text.call_args[0][0]
+    assert "healthy" in message
+    assert config.CREDENTIALS_PATH in message
+    assert config.TUTORS_CONFIG_PATH in message
@@ -58,6 +58,13 @@ class TestStudent:
         assert data["name"] == "Frank"
         assert data["telegram_id"] == "999"
 
+    def test_student_uses_slots(self):
+        """Test student instances carry no per-instance __dict__."""
+        student = Student(name="Grace")
+        assert not hasattr(student, "__dict__")
+        with pytest.raises(AttributeError):
+            student.nickname = "G"
+
 
 class TestLesson:
     """Test Lesson model."""
@@ -92,6 +99,15 @@ class TestLesson:
         assert lesson.time == "09:00"
         assert lesson.sheet_row == 10
 
+    def test_lesson_from_row_partial(self):
+        """Test creating lesson from partial row keeps required fields as strings."""
+        lesson = Lesson.from_row(["Dana"], sheet_row=4)
+        assert lesson.student_name == "Dana"
+        assert lesson.date == ""
+        assert lesson.time is None
+        assert lesson.notes is None
+        assert lesson.sheet_row == 4
+
 
 class TestPayment:
     """Test Payment model."""
@@ -124,6 +140,14 @@ class TestPayment:
         assert payment.date == "2024-01-17"
         assert payment.sheet_row == 3
 
+    def test_payment_from_row_empty_optional(self):
+        """Test empty optional cells become None."""
+        payment = Payment.from_row(["Eve", "300", "2024-01-18", ""])
+        assert payment.amount == "300"
+        assert payment.method is None
+        assert payment.notes is None
+        assert payment.sheet_row == 0
+
 
 class TestTutorConfig:
     """Test TutorConfig model."""
@@ -136,6 +160,8 @@ class TestTutorConfig:
         assert config.telegram_id == "12345"
         assert config.name == "John"
         assert config.sheets_id == "sheet-123"
+        assert config.created_at
+        assert config.updated_at == config.created_at
 
     def test_tutor_config_to_dict(self):
         """Test converting tutor config to dict."""
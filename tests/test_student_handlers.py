@@ -0,0 +1,316 @@
+"""Tests for student management handlers."""
+
+import pytest
+from unittest.mock import Mock, AsyncMock, MagicMock
+
+from telegram import Update, Message, User, Chat
+from telegram.ext import ContextTypes, ConversationHandler
+
+from handlers.students import (
+    DEL_AWAITING_CONFIRM,
+    StudentHandlers,
+    _split_message,
+    setup_student_handlers,
+)
+from utils.models import StudentRecord, TutorConfig
+
+
+class TestSplitMessage:
+    """Tests for message splitting."""
+
+    def test_single_chunk(self):
+        """Test short lists fit in one message."""
+        assert _split_message("Header\n", ["a", "b"]) == ["Header\na\nb\n"]
+
+    def test_breaks_between_lines(self):
+        """Test long lists are split on line boundaries within the limit."""
+        chunks = _split_message("H\n", ["x" * 5] * 3, limit=14)
+        assert chunks == ["H\nxxxxx\nxxxxx\n", "xxxxx\n"]
+        assert all(len(chunk) <= 14 for chunk in chunks)
+
+
+class TestListStudents:
+    """Tests for /list_students."""
+
+    @pytest.fixture
+    def sheets_manager(self):
+        """Create a mock SheetsManager."""
+        manager = MagicMock()
+        manager.get_student_records.return_value = [
+            StudentRecord("Anna", "Masha", "1000", sheet_row=2),
+            StudentRecord("Oleg", "Petya", "1500", sheet_row=3),
+        ]
+        return manager
+
+    @pytest.fixture
+    def student_handlers(self, sheets_manager):
+        """Create StudentHandlers for a registered tutor."""
+        tutors_db = MagicMock()
+        tutors_db.get_tutor.return_value = TutorConfig(
+            telegram_id="123456789", name="John Doe", sheets_id="sheet-1"
+        )
+        return StudentHandlers(tutors_db, sheets_manager)
+
+    @pytest.fixture
+    def mock_update(self):
+        """Create a mock Update object."""
+        update = Mock(spec=Update)
+        update.effective_user = Mock(spec=User)
+        update.effective_user.id = 123456789
+        update.effective_chat = Mock(spec=Chat)
+        update.effective_chat.id = 123456789
+        update.message = Mock(spec=Message)
+        update.message.reply_text = AsyncMock()
+        return update
+
+    @pytest.fixture
+    def mock_context(self):
+        """Create a mock ContextTypes."""
+        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+        context.user_data = {}
+        context.args = []
+        return context
+
+    @pytest.mark.asyncio
+    async def test_list_students(
+        self, student_handlers, mock_update, mock_context
+    ):
+        """Test the list is rendered in one message."""
+        await student_handlers.list_students_command(mock_update, mock_context)
+
+        mock_update.message.reply_text.assert_called_once()
+        message = mock_update.message.reply_text.call_args[0][0]
+        assert "1. Anna → Masha (1000)" in message
+        assert "2. Oleg → Petya (1500)" in message
+
+    @pytest.mark.asyncio
+    async def test_list_students_cached_until_write(
+        self, student_handlers, sheets_manager, mock_update, mock_context
+    ):
+        """Test repeated listings reuse the rendering until a student is added."""
+        await student_handlers.list_students_command(mock_update, mock_context)
+        await student_handlers.list_students_command(mock_update, mock_context)
+        assert sheets_manager.get_student_records.call_count == 1
+
+        mock_context.args = ["Anna", "Sasha", "900"]
+        await student_handlers.add_student_start(mock_update, mock_context)
+        mock_context.args = []
+
+        await student_handlers.list_students_command(mock_update, mock_context)
+        assert sheets_manager.get_student_records.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_list_not_cached_when_write_races_render(
+        self, student_handlers, sheets_manager, mock_update, mock_context
+    ):
+        """Test a rendering fetched before a concurrent write is not stored."""
+        records = sheets_manager.get_student_records.return_value
+
+        def write_during_fetch(sheets_id):
+            student_handlers._invalidate_list(sheets_id)
+            return records
+
+        sheets_manager.get_student_records.side_effect = write_during_fetch
+        await student_handlers.list_students_command(mock_update, mock_context)
+
+        assert "sheet-1" not in student_handlers._list_cache
+
+    @pytest.mark.asyncio
+    async def test_expired_lists_pruned(
+        self, student_handlers, mock_update, mock_context
+    ):
+        """Test storing a rendering drops expired ones for other sheets."""
+        student_handlers._list_cache["old-sheet"] = (-1000.0, ["stale"])
+
+        await student_handlers.list_students_command(mock_update, mock_context)
+
+        assert list(student_handlers._list_cache) == ["sheet-1"]
+
+    @pytest.mark.asyncio
+    async def test_interactive_add_looks_up_tutor_once(
+        self, student_handlers, sheets_manager, mock_update, mock_context
+    ):
+        """Test the tutor is fetched at start and user_data cleared at the end."""
+        await student_handlers.add_student_start(mock_update, mock_context)
+        assert mock_context.user_data["sheets_id"] == "sheet-1"
+
+        for text, handler in (
+            ("Anna", student_handlers.add_student_parent),
+            ("Sasha", student_handlers.add_student_student),
+            ("900", student_handlers.add_student_cost),
+        ):
+            mock_update.message.text = text
+            await handler(mock_update, mock_context)
+
+        student_handlers.tutors_db.get_tutor.assert_called_once()
+        sheets_manager.add_student_record.assert_called_once_with(
+            "sheet-1", "Anna", "Sasha", "900"
+        )
+        assert mock_context.user_data == {}
+
+
+class TestAddStudentArgs:
+    """Tests for /add_student with inline arguments."""
+
+    @pytest.mark.asyncio
+    async def test_multi_word_parent_name(self):
+        """Test every argument before the last two forms the parent name."""
+        tutors_db = MagicMock()
+        tutors_db.get_tutor.return_value = TutorConfig(
+            telegram_id="1", name="John Doe", sheets_id="sheet-1"
+        )
+        sheets_manager = MagicMock()
+        handlers = StudentHandlers(tutors_db, sheets_manager)
+
+        update = Mock(spec=Update)
+        update.effective_user = Mock(spec=User)
+        update.effective_user.id = 1
+        update.effective_chat = Mock(spec=Chat)
+        update.effective_chat.id = 1
+        update.message = Mock(spec=Message)
+        update.message.reply_text = AsyncMock()
+        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+        context.user_data = {}
+        context.args = ["Anna", "Maria", "Sasha", "900"]
+
+        await handlers.add_student_start(update, context)
+
+        sheets_manager.add_student_record.assert_called_once_with(
+            "sheet-1", "Anna Maria", "Sasha", "900"
+        )
+
+
+class TestDeleteStudentConfirm:
+    """Tests for the /confirm step of /delete_student."""
+
+    @pytest.fixture
+    def student_handlers(self):
+        """Create StudentHandlers with a listing already cached."""
+        tutors_db = MagicMock()
+        tutors_db.get_tutor.return_value = TutorConfig(
+            telegram_id="1", name="John Doe", sheets_id="sheet-1"
+        )
+        sheets_manager = MagicMock()
+        sheets_manager.delete_student_record.return_value = True
+        handlers = StudentHandlers(tutors_db, sheets_manager)
+        handlers._list_cache["sheet-1"] = (0.0, ["cached"])
+        return handlers
+
+    @pytest.fixture
+    def mock_update(self):
+        """Create a mock Update object."""
+        update = Mock(spec=Update)
+        update.effective_user = Mock(spec=User)
+        update.effective_user.id = 1
+        update.effective_chat = Mock(spec=Chat)
+        update.effective_chat.id = 1
+        update.message = Mock(spec=Message)
+        update.message.reply_text = AsyncMock()
+        return update
+
+    @pytest.fixture
+    def mock_context(self):
+        """Create a context waiting for confirmation."""
+        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+        context.user_data = {
+            "sheets_id": "sheet-1",
+            "parent_name": "Anna",
+            "student_name": "Sasha",
+        }
+        context.args = []
+        return context
+
+    @pytest.mark.asyncio
+    async def test_confirm_deletes(
+        self, student_handlers, mock_update, mock_context
+    ):
+        """Test /confirm deletes the student and drops the cached listing."""
+        state = await student_handlers.delete_student_confirm(
+            mock_update, mock_context
+        )
+
+        assert state == ConversationHandler.END
+        student_handlers.sheets_manager.delete_student_record.assert_called_once_with(
+            "sheet-1", "Anna", "Sasha"
+        )
+        assert "sheet-1" not in student_handlers._list_cache
+        assert mock_context.user_data == {}
+
+    @pytest.mark.asyncio
+    async def test_other_text_reprompts(
+        self, student_handlers, mock_update, mock_context
+    ):
+        """Test any other text repeats the prompt without deleting."""
+        mock_update.message.text = "yes"
+
+        state = await student_handlers.delete_student_reprompt(
+            mock_update, mock_context
+        )
+
+        assert state == DEL_AWAITING_CONFIRM
+        student_handlers.sheets_manager.delete_student_record.assert_not_called()
+        assert "Anna" in mock_update.message.reply_text.call_args[0][0]
+        assert mock_context.user_data["student_name"] == "Sasha"
+
+    @pytest.mark.asyncio
+    async def test_cancel_ends_conversation(
+        self, student_handlers, mock_update, mock_context
+    ):
+        """Test /cancel ends the conversation without deleting."""
+        state = await student_handlers.delete_student_cancel(
+            mock_update, mock_context
+        )
+
+        assert state == ConversationHandler.END
+        student_handlers.sheets_manager.delete_student_record.assert_not_called()
+        assert mock_context.user_data == {}
+
+    def test_confirm_state_routing(self, student_handlers):
+        """Test /confirm and plain text reach their handlers in the confirm state."""
+        conversation = student_handlers.get_delete_student_handler()
+        confirm, reprompt = conversation.states[DEL_AWAITING_CONFIRM]
+
+        assert confirm.commands == frozenset({"confirm"})
+        assert confirm.callback == student_handlers.delete_student_confirm
+        assert reprompt.callback == student_handlers.delete_student_reprompt
+
+
+class TestConversationHandlers:
+    """Tests for the conversation handler graphs."""
+
+    @pytest.mark.parametrize(
+        "factory", ["get_add_student_handler", "get_delete_student_handler"]
+    )
+    def test_cancel_only_in_fallbacks(self, factory):
+        """Test /cancel is registered once, as a fallback."""
+        handlers = StudentHandlers(MagicMock(), MagicMock())
+        conversation = getattr(handlers, factory)()
+
+        for state_handlers in conversation.states.values():
+            for handler in state_handlers:
+                commands = getattr(handler, "commands", frozenset())
+                assert "cancel" not in commands
+        assert [h.commands for h in conversation.fallbacks] == [
+            frozenset({"cancel"})
+        ]
+
+    @pytest.mark.parametrize(
+        "factory", ["get_add_student_handler", "get_delete_student_handler"]
+    )
+    def test_conversation_blocks(self, factory):
+        """Test steps of one conversation are not dropped while one is running."""
+        handlers = StudentHandlers(MagicMock(), MagicMock())
+        assert getattr(handlers, factory)().block is True
+
+
+def test_setup_uses_bot_data():
+    """Test handlers are wired to the instances stored in bot_data."""
+    application = MagicMock()
+    application.bot_data = {"tutors_db": MagicMock(), "sheets_manager": MagicMock()}
+
+    setup_student_handlers(application)
+
+    conversation = application.add_handler.call_args_list[0][0][0]
+    handlers = conversation.entry_points[0].callback.__self__
+    assert handlers.tutors_db is application.bot_data["tutors_db"]
+    assert handlers.sheets_manager is application.bot_data["sheets_manager"]
@@ -6,8 +6,13 @@ import json
 import tempfile
 from threading import Thread
 
+from database import tutors_db as tutors_db_module
 from database.tutors_db import TutorsDB
-from database.exceptions import TutorNotFoundError, TutorAlreadyExistsError
+from database.exceptions import (
+    TutorNotFoundError,
+    TutorAlreadyExistsError,
+    ConfigurationError,
+)
 from utils.models import TutorConfig
 
 
@@ -36,6 +41,16 @@ class TestTutorsDB:
         assert "tutors" in data
         assert data["tutors"] == []
 
+    def test_unicode_names_roundtrip(self, temp_db):
+        """Test non-ASCII names are stored as UTF-8 and read back unchanged."""
+        db = TutorsDB(temp_db)
+        db.register_tutor("321", "Анна Петрова", "sheet-ru")
+
+        with open(temp_db, encoding="utf-8") as f:
+            assert "Анна Петрова" in f.read()
+
+        assert TutorsDB(temp_db).get_tutor("321").name == "Анна Петрова"
+
     def test_register_tutor(self, temp_db):
         """Test registering a tutor."""
         db = TutorsDB(temp_db)
@@ -169,3 +184,96 @@ class TestTutorsDB:
 
         tutors = db.list_tutors()
         assert len(tutors) == 0
+
+    def test_reads_are_cached(self, temp_db, monkeypatch):
+        """Test the database file is parsed only when it changes."""
+        monkeypatch.setattr(tutors_db_module, "TUTOR_CACHE_TTL", 0)
+        db = TutorsDB(temp_db)
+        db.register_tutor("666", "Grace", "sheet-g")
+
+        loads = []
+        original_loads = tutors_db_module._loads
+        monkeypatch.setattr(
+            tutors_db_module,
+            "_loads",
+            lambda raw: loads.append(1) or original_loads(raw),
+        )
+
+        db.get_tutor("666")
+        db.list_tutors()
+        assert loads == []
+
+        with open(temp_db, "w") as f:
+            json.dump({"tutors": []}, f)
+
+        assert db.tutor_exists("666") is False
+        assert loads == [1]
+
+    def test_loaded_on_init(self, temp_db, monkeypatch):
+        """Test a new instance parses the file once, before the first lookup."""
+        TutorsDB(temp_db).register_tutor("555", "Frank", "sheet-f")
+
+        loads = []
+        original_loads = tutors_db_module._loads
+        monkeypatch.setattr(
+            tutors_db_module,
+            "_loads",
+            lambda raw: loads.append(1) or original_loads(raw),
+        )
+
+        db = TutorsDB(temp_db)
+        assert loads == [1]
+        assert db.get_tutor("555").name == "Frank"
+        assert loads == [1]
+
+    def test_lookups_are_cached(self, temp_db, monkeypatch):
+        """Test lookups skip the file within the TTL until the next write."""
+        db = TutorsDB(temp_db)
+        assert db.tutor_exists("888") is False
+
+        stats = []
+        original_stat = tutors_db_module.os.stat
+        monkeypatch.setattr(
+            tutors_db_module.os,
+            "stat",
+            lambda path: stats.append(path) or original_stat(path),
+        )
+
+        with pytest.raises(TutorNotFoundError):
+            db.get_tutor("888")
+        assert stats == []
+
+        db.register_tutor("888", "Ivan", "sheet-i")
+        stats.clear()
+
+        assert db.get_tutor("888").name == "Ivan"
+        assert db.get_tutor("888").name == "Ivan"
+        assert len(stats) == 1
+
+    def test_cached_lookup_does_not_wait_for_lock(self, temp_db):
+        """Test cached lookups are answered while a write holds the lock."""
+        db = TutorsDB(temp_db)
+        db.register_tutor("999", "Judy", "sheet-j")
+        db.get_tutor("999")
+
+        with db._lock:
+            assert db.get_tutor("999").name == "Judy"
+            assert db.tutor_exists("999") is True
+
+    def test_write_is_atomic(self, temp_db, monkeypatch):
+        """Test a failed write leaves the previous database intact."""
+        db = TutorsDB(temp_db)
+        db.register_tutor("777", "Heidi", "sheet-h")
+
+        def failing_dumps(data):
+            raise IOError("disk full")
+
+        monkeypatch.setattr(tutors_db_module, "_dumps", failing_dumps)
+
+        with pytest.raises(ConfigurationError):
+            db.register_tutor("888", "Ivan", "sheet-i")
+
+        assert not os.path.exists(temp_db + ".tmp")
+        with open(temp_db) as f:
+            data = json.load(f)
+        assert [t["telegram_id"] for t in data["tutors"]] == ["777"]
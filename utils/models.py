@@ -1,11 +1,15 @@
 """Data models and dataclasses for Sheets backend."""
 
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass
 from typing import Optional, Any, Dict, List
 from datetime import datetime
 
+# Appended to short rows so every column can be indexed; as many blanks
+# as the widest model has columns
+_PADDING = ("",) * 6
 
-@dataclass
+
+@dataclass(slots=True)
 class Student:
     """Model for a student record."""
     name: str
@@ -17,7 +21,14 @@ class Student:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "name": self.name,
+            "telegram_id": self.telegram_id,
+            "email": self.email,
+            "phone": self.phone,
+            "notes": self.notes,
+            "sheet_row": self.sheet_row,
+        }
 
     def to_row(self) -> List[str]:
         """Convert to row format for sheets."""
@@ -32,17 +43,19 @@ class Student:
     @classmethod
     def from_row(cls, row: List[str], sheet_row: int = 0) -> "Student":
         """Create from row data."""
+        if len(row) < 5:
+            row = (*row, *_PADDING)
         return cls(
-            name=row[0] if len(row) > 0 else "",
-            telegram_id=row[1] if len(row) > 1 and row[1] else None,
-            email=row[2] if len(row) > 2 and row[2] else None,
-            phone=row[3] if len(row) > 3 and row[3] else None,
-            notes=row[4] if len(row) > 4 and row[4] else None,
-            sheet_row=sheet_row,
+            row[0],
+            row[1] or None,
+            row[2] or None,
+            row[3] or None,
+            row[4] or None,
+            sheet_row,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Lesson:
     """Model for a lesson record."""
     student_name: str
@@ -55,7 +68,15 @@ class Lesson:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "student_name": self.student_name,
+            "date": self.date,
+            "time": self.time,
+            "duration": self.duration,
+            "topic": self.topic,
+            "notes": self.notes,
+            "sheet_row": self.sheet_row,
+        }
 
     def to_row(self) -> List[str]:
         """Convert to row format for sheets."""
@@ -71,18 +92,20 @@ class Lesson:
     @classmethod
     def from_row(cls, row: List[str], sheet_row: int = 0) -> "Lesson":
         """Create from row data."""
+        if len(row) < 6:
+            row = (*row, *_PADDING)
         return cls(
-            student_name=row[0] if len(row) > 0 else "",
-            date=row[1] if len(row) > 1 else "",
-            time=row[2] if len(row) > 2 and row[2] else None,
-            duration=row[3] if len(row) > 3 and row[3] else None,
-            topic=row[4] if len(row) > 4 and row[4] else None,
-            notes=row[5] if len(row) > 5 and row[5] else None,
-            sheet_row=sheet_row,
+            row[0],
+            row[1],
+            row[2] or None,
+            row[3] or None,
+            row[4] or None,
+            row[5] or None,
+            sheet_row,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     """Model for a payment record."""
     student_name: str
@@ -94,7 +117,14 @@ class Payment:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "student_name": self.student_name,
+            "amount": self.amount,
+            "date": self.date,
+            "method": self.method,
+            "notes": self.notes,
+            "sheet_row": self.sheet_row,
+        }
 
     def to_row(self) -> List[str]:
         """Convert to row format for sheets."""
@@ -109,28 +139,47 @@ class Payment:
     @classmethod
     def from_row(cls, row: List[str], sheet_row: int = 0) -> "Payment":
         """Create from row data."""
+        if len(row) < 5:
+            row = (*row, *_PADDING)
         return cls(
-            student_name=row[0] if len(row) > 0 else "",
-            amount=row[1] if len(row) > 1 else "",
-            date=row[2] if len(row) > 2 else "",
-            method=row[3] if len(row) > 3 and row[3] else None,
-            notes=row[4] if len(row) > 4 and row[4] else None,
-            sheet_row=sheet_row,
+            row[0],
+            row[1],
+            row[2],
+            row[3] or None,
+            row[4] or None,
+            sheet_row,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TutorConfig:
-    """Model for tutor configuration."""
+    """Model for tutor configuration.
+
+    Missing timestamps are set to the construction time, read from the
+    clock once for both fields.
+    """
     telegram_id: str
     name: str
     sheets_id: str
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    created_at: str = ""
+    updated_at: str = ""
+
+    def __post_init__(self) -> None:
+        """Fill in missing timestamps."""
+        if not (self.created_at and self.updated_at):
+            now = datetime.now().isoformat()
+            self.created_at = self.created_at or now
+            self.updated_at = self.updated_at or now
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            "telegram_id": self.telegram_id,
+            "name": self.name,
+            "sheets_id": self.sheets_id,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TutorConfig":
@@ -139,6 +188,39 @@ class TutorConfig:
             telegram_id=data["telegram_id"],
             name=data["name"],
             sheets_id=data["sheets_id"],
-            created_at=data.get("created_at", datetime.now().isoformat()),
-            updated_at=data.get("updated_at", datetime.now().isoformat()),
+            created_at=data.get("created_at", ""),
+            updated_at=data.get("updated_at", ""),
         )
+
+
+@dataclass(slots=True)
+class StudentRecord:
+    """Model for a student record in the Ученики worksheet."""
+    parent_name: str
+    student_name: str
+    lesson_cost: str
+    sheet_row: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "parent_name": self.parent_name,
+            "student_name": self.student_name,
+            "lesson_cost": self.lesson_cost,
+            "sheet_row": self.sheet_row,
+        }
+
+    def to_row(self) -> List[str]:
+        """Convert to row format for sheets."""
+        return [
+            self.parent_name,
+            self.student_name,
+            self.lesson_cost,
+        ]
+
+    @classmethod
+    def from_row(cls, row: List[str], sheet_row: int = 0) -> "StudentRecord":
+        """Create from row data."""
+        if len(row) < 3:
+            row = (*row, *_PADDING)
+        return cls(row[0], row[1], row[2], sheet_row)
@@ -1,9 +1,25 @@
-"""Input validation utilities for the bot."""
+"""Input validation utilities for the bot.
+
+The validators are pure functions of a string, so their results are
+memoized: tutors re-enter the same names and re-paste the same links.
+"""
 
 import re
+import string
+from functools import lru_cache
 from typing import Optional
 
+# Sheet ID inside a Google Sheets URL
+_SHEET_URL_RE = re.compile(r'docs\.google\.com/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# Bare sheet ID: ASCII alphanumeric with hyphens and underscores
+_SHEET_ID_CHARS = (string.ascii_letters + string.digits + '-_').encode('ascii')
+
+# Letters (Latin and Cyrillic), digits, spaces, hyphens, and apostrophes
+_NAME_RE = re.compile(r"[a-zA-Zа-яА-ЯёЁ0-9\s\-']+")
+
 
+@lru_cache(maxsize=2048)
 def extract_sheet_id(input_string: str) -> Optional[str]:
     """Extract Google Sheets ID from a URL or return the input if it looks like an ID.
 
@@ -24,18 +40,22 @@ def extract_sheet_id(input_string: str) -> Optional[str]:
     input_string = input_string.strip()
 
     # Try to extract from URL
-    url_pattern = r'docs\.google\.com/spreadsheets/d/([a-zA-Z0-9-_]+)'
-    match = re.search(url_pattern, input_string)
+    match = _SHEET_URL_RE.search(input_string)
     if match:
         return match.group(1)
 
-    # Check if it's a valid sheet ID format (alphanumeric with hyphens and underscores)
-    if re.match(r'^[a-zA-Z0-9-_]+$', input_string) and len(input_string) > 10:
+    # Check if it's a valid sheet ID format
+    if (
+        len(input_string) > 10
+        and input_string.isascii()
+        and not input_string.encode('ascii').translate(None, _SHEET_ID_CHARS)
+    ):
         return input_string
 
     return None
 
 
+@lru_cache(maxsize=2048)
 def validate_name(name: str) -> bool:
     """Validate a tutor name.
 
@@ -50,10 +70,10 @@ def validate_name(name: str) -> bool:
     # Allow letters, digits, spaces, and common punctuation
     if not name or len(name) < 2 or len(name) > 100:
         return False
-    # Allow letters, digits, spaces, hyphens, and apostrophes
-    return bool(re.match(r"^[a-zA-Zа-яА-ЯёЁ0-9\s\-']+$", name))
+    return _NAME_RE.fullmatch(name) is not None
 
 
+@lru_cache(maxsize=2048)
 def sanitize_name(name: str) -> str:
     """Sanitize a tutor name by stripping whitespace.
 
@@ -63,4 +83,5 @@ def sanitize_name(name: str) -> str:
     Returns:
         The sanitized name.
     """
-    return ' '.join(name.strip().split())
+    # split() without arguments already drops leading and trailing whitespace
+    return ' '.join(name.split())